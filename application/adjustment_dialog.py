@@ -2,7 +2,7 @@ from PyQt5.QtWidgets import QDialog, QVBoxLayout, QTextEdit, QPushButton, QMessa
 from PyQt5.QtCore import Qt
 import logging
 
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 class AdjustmentDialog(QDialog):
     def __init__(self, adjustments, appliances, parent=None):
@@ -69,4 +69,4 @@ class AdjustmentDialog(QDialog):
         layout.addWidget(ok_button, alignment=Qt.AlignCenter)
 
         self.setLayout(layout)
-        logging.debug("AdjustmentDialog UI initialized")
\ No newline at end of file
+        logger.debug("AdjustmentDialog UI initialized")
@@ -1,7 +1,7 @@
 import numpy as np
 import logging
 
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 class ApplianceBalancer:
     def __init__(self, bill_calculator):
@@ -12,7 +12,7 @@ class ApplianceBalancer:
             bill_calculator (BillCalculator): Instance to calculate costs.
         """
         self.bill_calculator = bill_calculator
-        logging.debug("ApplianceBalancer initialized")
+        logger.debug("ApplianceBalancer initialized")
 
     def balance_appliances(self, appliances, daily_costs, max_monthly_bill, valid_indices):
         """
@@ -31,17 +31,17 @@ class ApplianceBalancer:
                 - adjusted_appliances: Updated list of appliances with adjusted usage times.
                 - adjustments: Dictionary of adjustments for display.
         """
-        # Make a copy of appliances to avoid modifying the original list
-        adjusted_appliances = appliances.copy()
+        # Copy each appliance dict so usage edits don't leak into the caller's data
+        adjusted_appliances = [dict(appliance) for appliance in appliances]
         adjustments = {}
 
         # Calculate the initial total monthly bill
         total_monthly_bill, monthly_costs = self.bill_calculator.calculate_monthly_bill(daily_costs)
-        logging.debug(f"Initial monthly bill: ${total_monthly_bill:.2f}, Threshold: ${max_monthly_bill:.2f}")
+        logger.debug("Initial monthly bill: $%.2f, Threshold: $%.2f", total_monthly_bill, max_monthly_bill)
 
         # If the total monthly bill is already below the threshold or threshold is invalid, no adjustments needed
         if total_monthly_bill <= max_monthly_bill or max_monthly_bill <= 0:
-            logging.debug("No adjustments needed: Bill below threshold or invalid threshold")
+            logger.debug("No adjustments needed: Bill below threshold or invalid threshold")
             return adjusted_appliances, adjustments
 
         # Step 1: Separate appliances into categories
@@ -56,13 +56,13 @@ class ApplianceBalancer:
             device_type = adjusted_appliances[orig_idx]["Device Type"]
             if device_type in ["Refrigerator", "Washing Machine", "Smart Plug"]:
                 excluded_indices.append((idx, orig_idx))
-                logging.debug(f"Skipping {device_type} at index {orig_idx} (excluded from adjustments)")
+                logger.debug("Skipping %s at index %s (excluded from adjustments)", device_type, orig_idx)
             elif device_type in ["Heater", "TV", "Ceiling Fan", "Air Conditioner", "Microwave"]:
                 balancing_indices.append((idx, orig_idx))
-                logging.debug(f"Adding {device_type} at index {orig_idx} to balancing list")
+                logger.debug("Adding %s at index %s to balancing list", device_type, orig_idx)
             else:
                 other_indices.append((idx, orig_idx))
-                logging.debug(f"Adding {device_type} at index {orig_idx} to others list (will set max usage)")
+                logger.debug("Adding %s at index %s to others list (will set max usage)", device_type, orig_idx)
 
         # Step 2: Allocate budget for non-balancing appliances (others) and set maximum usage
         # Allocate 20% of the threshold to non-balancing appliances (adjustable parameter)
@@ -74,7 +74,7 @@ class ApplianceBalancer:
         excluded_monthly_cost = excluded_daily_cost * 30
         remaining_budget -= excluded_monthly_cost
         if remaining_budget <= 0:
-            logging.warning("Excluded appliances alone exceed the threshold. Cannot balance further.")
+            logger.warning("Excluded appliances alone exceed the threshold. Cannot balance further.")
             return adjusted_appliances, adjustments
 
         # Calculate cost per minute for non-balancing appliances (others)
@@ -120,17 +120,17 @@ class ApplianceBalancer:
                 # Adjust daily cost
                 scale_factor = new_usage_minutes / original_usage_minutes
                 daily_costs[idx] *= scale_factor
-                logging.debug(f"Set max usage for {appliance['Device Type']}: {new_usage_minutes:.2f} minutes")
+                logger.debug("Set max usage for %s: %.2f minutes", appliance['Device Type'], new_usage_minutes)
 
         # Step 3: Recalculate remaining bill after setting max usage for others
         total_monthly_bill = np.sum(daily_costs * 30)
         if total_monthly_bill <= max_monthly_bill:
-            logging.debug("Bill below threshold after setting max usage for others")
+            logger.debug("Bill below threshold after setting max usage for others")
             return adjusted_appliances, adjustments
 
         # Step 4: Balance the balancing appliances
         if not balancing_indices:
-            logging.debug("No appliances in balancing list to adjust")
+            logger.debug("No appliances in balancing list to adjust")
             return adjusted_appliances, adjustments
 
         # Calculate cost per minute for balancing appliances
@@ -147,7 +147,7 @@ class ApplianceBalancer:
         while total_monthly_bill > max_monthly_bill:
             # Calculate the excess cost to reduce
             excess_cost = total_monthly_bill - max_monthly_bill
-            logging.debug(f"Excess cost to reduce: ${excess_cost:.2f}")
+            logger.debug("Excess cost to reduce: $%.2f", excess_cost)
 
             # Calculate total cost per minute for balancing appliances
             total_cost_per_minute = sum(
@@ -158,7 +158,7 @@ class ApplianceBalancer:
 
             # If no further adjustments are possible, break the loop
             if total_cost_per_minute <= 0:
-                logging.debug("No further usage adjustments possible for balancing appliances")
+                logger.debug("No further usage adjustments possible for balancing appliances")
                 break
 
             # Distribute the reduction proportionally based on cost per minute
@@ -203,5 +203,5 @@ class ApplianceBalancer:
             # Recalculate total monthly bill with adjusted costs
             total_monthly_bill = np.sum(daily_costs * 30)
 
-        logging.debug(f"Final adjusted monthly bill: ${total_monthly_bill:.2f}")
+        logger.debug("Final adjusted monthly bill: $%.2f", total_monthly_bill)
         return adjusted_appliances, adjustments
\ No newline at end of file
@@ -1,11 +1,46 @@
+import functools
 import json
+import re
+import threading
+import time
 import requests
-from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime
 from PyQt5.QtWidgets import QDialog, QVBoxLayout, QTextEdit, QPushButton
 from PyQt5.QtCore import Qt
 import logging
 
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+_TEXT_AREA_QSS = """
+    QTextEdit {
+        background-color: #547792;
+        color: #ECEFCA;
+        border: 1px solid #213448;
+        border-radius: 6px;
+        padding: 6px;
+        font-family: Roboto, Arial;
+        font-size: 10pt;
+    }
+"""
+
+_OK_BUTTON_QSS = """
+    QPushButton {
+        background-color: #213448;
+        color: #ECEFCA;
+        border: none;
+        padding: 8px 16px;
+        font-size: 12pt;
+        font-weight: bold;
+        border-radius: 8px;
+        font-family: Roboto, Arial;
+    }
+    QPushButton:hover { background-color: #94B4C1; }
+"""
+
+_COMMANDS_HEADER = "Appliance Control Commands:\n" + "=" * 50 + "\n\n"
+_COMMAND_SEPARATOR = "-" * 50 + "\n"
 
 class ApplianceControlDialog(QDialog):
     def __init__(self, commands, parent=None):
@@ -33,69 +68,100 @@ class ApplianceControlDialog(QDialog):
         # Text area to display commands
         text_area = QTextEdit()
         text_area.setReadOnly(True)
-        text_area.setStyleSheet("""
-            QTextEdit {
-                background-color: #547792;
-                color: #ECEFCA;
-                border: 1px solid #213448;
-                border-radius: 6px;
-                padding: 6px;
-                font-family: Roboto, Arial;
-                font-size: 10pt;
-            }
-        """)
+        text_area.setStyleSheet(_TEXT_AREA_QSS)
 
         # Build the command message
         if not commands:
             text_area.setText("No appliance control commands generated.")
         else:
-            message = "Appliance Control Commands:\n" + "=" * 50 + "\n\n"
-            for cmd in commands:
-                message += f"Device: {cmd['device']}\nAction: {cmd['action']}\nTime: {cmd['time']}\n" + "-" * 50 + "\n"
-            text_area.setText(message)
+            parts = [_COMMANDS_HEADER]
+            parts.extend(
+                f"Device: {cmd['device']}\nAction: {cmd['action']}\nTime: {cmd['time']}\n{_COMMAND_SEPARATOR}"
+                for cmd in commands
+            )
+            text_area.setText("".join(parts))
 
         layout.addWidget(text_area)
 
         # OK button to close the dialog
         ok_button = QPushButton("OK")
-        ok_button.setStyleSheet("""
-            QPushButton {
-                background-color: #213448;
-                color: #ECEFCA;
-                border: none;
-                padding: 8px 16px;
-                font-size: 12pt;
-                font-weight: bold;
-                border-radius: 8px;
-                font-family: Roboto, Arial;
-            }
-            QPushButton:hover { background-color: #94B4C1; }
-        """)
+        ok_button.setStyleSheet(_OK_BUTTON_QSS)
         ok_button.clicked.connect(self.accept)
         layout.addWidget(ok_button, alignment=Qt.AlignCenter)
 
         self.setLayout(layout)
-        logging.debug("ApplianceControlDialog UI initialized")
+        logger.debug("ApplianceControlDialog UI initialized")
+
+WEATHER_URL = "http://api.weatherapi.com/v1/current.json?key=f002f472449b4c6d89f154907251205&q=Hanoi"
+
+WEATHER_TIMEOUT = (2, 4)  # (connect, read) seconds
+WEATHER_CACHE_TTL = 300  # seconds; current conditions change on the order of minutes
+
+_session = None
+_session_lock = threading.Lock()
+
+# Maps a query location to (fetched_at, (location, temperature, humidity))
+_weather_cache = {}
+_weather_cache_lock = threading.Lock()
+
+def _get_session():
+    """
+    Return the shared HTTP session, creating it on first use.
+
+    Reusing one session keeps the connection to the weather API alive between
+    calls instead of paying a fresh TCP handshake every time. Transient
+    connection errors and 502/503/504 responses are retried with exponential
+    backoff.
+
+    Returns:
+        requests.Session: The module-wide session.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                retry = Retry(
+                    total=3,
+                    backoff_factor=0.3,
+                    status_forcelist=(502, 503, 504)
+                )
+                adapter = HTTPAdapter(max_retries=retry)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _session = session
+    return _session
 
 def fetch_weather_data():
     """
     Fetch current location, temperature, and humidity for Hanoi, Vietnam using WeatherAPI.com.
 
+    Successful responses are cached for WEATHER_CACHE_TTL seconds; calls inside
+    that window return the cached values without a network round-trip.
+
     Returns:
         tuple: (location (str), temperature (°C), humidity (%)), or (None, None, None) if failed.
     """
+    key = "Hanoi"
+    with _weather_cache_lock:
+        cached = _weather_cache.get(key)
+    if cached is not None and time.monotonic() - cached[0] < WEATHER_CACHE_TTL:
+        return cached[1]
+
     try:
-        url = "http://api.weatherapi.com/v1/current.json?key=f002f472449b4c6d89f154907251205&q=Hanoi"
-        response = requests.get(url, timeout=5)
+        response = _get_session().get(WEATHER_URL, timeout=WEATHER_TIMEOUT)
         response.raise_for_status()
         data = response.json()
         location = data['location']['name']
         temperature = data['current']['temp_c']
         humidity = data['current']['humidity']
-        logging.debug(f"Fetched weather for Hanoi: location={location}, temp={temperature}°C, humidity={humidity}%")
-        return location, temperature, humidity
+        logger.debug("Fetched weather for Hanoi: location=%s, temp=%s°C, humidity=%s%%", location, temperature, humidity)
+        result = (location, temperature, humidity)
+        with _weather_cache_lock:
+            _weather_cache[key] = (time.monotonic(), result)
+        return result
     except Exception as e:
-        logging.error(f"Failed to fetch weather data: {str(e)}")
+        logger.error("Failed to fetch weather data: %s", e)
         return None, None, None
 
 def load_return_time(file_path):
@@ -112,14 +178,56 @@ def load_return_time(file_path):
         with open(file_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
         if 'return_time' not in data:
-            logging.error("JSON file missing 'return_time' key")
+            logger.error("JSON file missing 'return_time' key")
             return None
-        logging.debug(f"Loaded return time: {data['return_time']}")
+        logger.debug("Loaded return time: %s", data['return_time'])
         return data['return_time']
     except Exception as e:
-        logging.error(f"Failed to load return time from {file_path}: {str(e)}")
+        logger.error("Failed to load return time from %s: %s", file_path, e)
         return None
 
+MINUTES_PER_DAY = 24 * 60
+
+_HHMM_MATCH = re.compile(r"\d{2}:\d{2}", re.ASCII).fullmatch
+
+def _parse_hhmm(value):
+    """
+    Parse an HH:MM string into (hour, minute).
+
+    Zero-padded input is handled with plain slicing; anything else falls back to
+    datetime.strptime so inputs such as "9:05" keep working.
+
+    Args:
+        value (str): Time string.
+
+    Returns:
+        tuple: (hour (int), minute (int)).
+
+    Raises:
+        ValueError: If the string is not a valid time.
+    """
+    if _HHMM_MATCH(value):
+        hour, minute = int(value[0:2]), int(value[3:5])
+        if hour < 24 and minute < 60:
+            return hour, minute
+        raise ValueError(f"time data {value!r} is out of range")
+    parsed = datetime.strptime(value, '%H:%M')
+    return parsed.hour, parsed.minute
+
+@functools.lru_cache(maxsize=MINUTES_PER_DAY)
+def _format_hhmm(minutes):
+    """
+    Format a minute offset from midnight as HH:MM, wrapping around the day.
+
+    Args:
+        minutes (int): Minutes from midnight; may be negative or exceed one day.
+
+    Returns:
+        str: Time of day (HH:MM).
+    """
+    hour, minute = divmod(minutes % MINUTES_PER_DAY, 60)
+    return f"{hour:02d}:{minute:02d}"
+
 def generate_control_commands(temperature, humidity, return_time):
     """
     Generate appliance control commands based on weather and return time.
@@ -134,53 +242,53 @@ def generate_control_commands(temperature, humidity, return_time):
     """
     commands = []
 
-    # Parse return time
+    # Parse return time as minutes from today's midnight
     try:
-        return_datetime = datetime.strptime(return_time, '%H:%M')
-        current_date = datetime.now().date()
-        return_datetime = datetime.combine(current_date, return_datetime.time())
-        if return_datetime < datetime.now():
-            return_datetime += timedelta(days=1)  # Assume next day if time has passed
+        hour, minute = _parse_hhmm(return_time)
     except ValueError as e:
-        logging.error(f"Invalid return_time format: {str(e)}")
+        logger.error("Invalid return_time format: %s", e)
         return commands
+    now = time.localtime()
+    return_minutes = hour * 60 + minute
+    if return_minutes < now.tm_hour * 60 + now.tm_min:
+        return_minutes += MINUTES_PER_DAY  # Assume next day if time has passed
 
     # Temperature-based commands
     if temperature is not None:
         if temperature > 25.0:  # High temperature
-            ac_time = return_datetime - timedelta(minutes=10)
+            ac_time = _format_hhmm(return_minutes - 10)
             commands.append({
                 'device': 'Air Conditioner',
                 'action': 'Turn On',
-                'time': ac_time.strftime('%H:%M')
+                'time': ac_time
             })
-            logging.debug("Generated AC command: Turn On at %s", ac_time.strftime('%H:%M'))
+            logger.debug("Generated AC command: Turn On at %s", ac_time)
         elif temperature < 18.0:  # Low temperature
-            heater_time = return_datetime - timedelta(minutes=20)
+            heater_time = _format_hhmm(return_minutes - 20)
             commands.append({
                 'device': 'Heater',
                 'action': 'Turn On',
-                'time': heater_time.strftime('%H:%M')
+                'time': heater_time
             })
-            logging.debug("Generated Heater command: Turn On at %s", heater_time.strftime('%H:%M'))
+            logger.debug("Generated Heater command: Turn On at %s", heater_time)
 
     # Water heater command
-    water_heater_time = return_datetime - timedelta(minutes=20)
+    water_heater_time = _format_hhmm(return_minutes - 20)
     commands.append({
         'device': 'Water Heater',
         'action': 'Turn On',
-        'time': water_heater_time.strftime('%H:%M')
+        'time': water_heater_time
     })
-    logging.debug("Generated Water Heater command: Turn On at %s", water_heater_time.strftime('%H:%M'))
+    logger.debug("Generated Water Heater command: Turn On at %s", water_heater_time)
 
     # Humidity-based command
     if humidity is not None and humidity > 60.0:  # High humidity
-        dehumidifier_time = return_datetime - timedelta(hours=3)
+        dehumidifier_time = _format_hhmm(return_minutes - 180)
         commands.append({
             'device': 'Dehumidifier',
             'action': 'Turn On',
-            'time': dehumidifier_time.strftime('%H:%M')
+            'time': dehumidifier_time
         })
-        logging.debug("Generated Dehumidifier command: Turn On at %s", dehumidifier_time.strftime('%H:%M'))
+        logger.debug("Generated Dehumidifier command: Turn On at %s", dehumidifier_time)
 
-    return commands
\ No newline at end of file
+    return commands
@@ -1,3 +1,5 @@
+import numpy as np
+
 class BillCalculator:
     def __init__(self, model):
         """
@@ -8,33 +10,37 @@ class BillCalculator:
         """
         self.model = model
 
-    def calculate_daily_costs(self, scaled_features):
+    def calculate_daily_costs(self, scaled_features, out=None):
         """
         Calculate daily costs for appliances based on scaled features.
 
         Args:
             scaled_features (numpy.ndarray): Scaled features for appliances.
+            out (numpy.ndarray, optional): Preallocated buffer, one entry per row of
+                scaled_features, that receives the costs instead of a new array.
 
         Returns:
-            list: List of daily costs for each appliance (in cents).
+            numpy.ndarray: Daily costs for each appliance (in cents); `out` if given.
         """
-        # Existing implementation (assumed correct, not modified)
         predictions = self.model.predict(scaled_features)
-        return predictions.tolist()  # Returns costs in cents
+        if out is None:
+            return predictions
+        np.copyto(out, predictions, casting='same_kind')
+        return out
 
     def calculate_monthly_bill(self, daily_costs):
         """
         Calculate the total monthly bill by summing daily costs and multiplying by 30.
 
         Args:
-            daily_costs (list): List of daily costs for each appliance (in cents).
+            daily_costs (array-like): Daily costs for each appliance (in cents).
 
         Returns:
             tuple: (total_monthly_bill, adjustments)
                 - total_monthly_bill (float): Total monthly bill in cents.
                 - adjustments (list): List of adjustments (empty for compatibility).
         """
-        total_daily_cost = sum(daily_costs)  # Sum daily costs in cents
+        total_daily_cost = float(np.sum(daily_costs))  # Sum daily costs in cents
         total_monthly_bill = total_daily_cost  # Multiply by 30 days
         adjustments = []  # No adjustments needed for this calculation
         return total_monthly_bill, adjustments
\ No newline at end of file
@@ -1,7 +1,109 @@
+import hashlib
 import json
 import logging
+import os
 
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; large files are then parsed in one go
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+# Files larger than this are stream-parsed (when ijson is installed) so the raw
+# bytes and the decoded objects are never held in memory at the same time.
+STREAM_PARSE_THRESHOLD_BYTES = 16 * 1024 * 1024
+
+def _loads(raw):
+    """
+    Parse JSON bytes, using orjson when it is available.
+
+    Args:
+        raw (bytes): Raw file contents.
+
+    Returns:
+        object: Decoded JSON value.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+def _dumps(obj):
+    """
+    Serialize an object to indented JSON bytes, using orjson when it is available.
+
+    Args:
+        obj: JSON-serializable value (NumPy scalars/arrays are accepted with orjson).
+
+    Returns:
+        bytes: UTF-8 encoded JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _digest(data):
+    """
+    Short content hash used to detect unchanged writes.
+
+    Args:
+        data (bytes): Serialized appliances.
+
+    Returns:
+        bytes: 16-byte BLAKE2b digest.
+    """
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+NUMERIC_COLUMNS = (
+    "Power Consumption (W)",
+    "Temperature (°C)",
+    "Humidity (%)",
+    "Usage Duration (minutes)",
+)
+CATEGORICAL_COLUMNS = (
+    "Date",
+    "Device Type",
+    "Room Location",
+    "On/Off Status",
+    "Turn On Time",
+)
+
+def appliances_to_columns(appliances):
+    """
+    Convert a list of appliance dictionaries into per-field NumPy columns.
+
+    Args:
+        appliances (list): List of appliance dictionaries.
+
+    Returns:
+        dict: Field name to 1-D array in record order; float64 for numeric
+            fields (NaN where a value is missing or not a number), object
+            arrays for categorical ones (None where missing).
+    """
+    count = len(appliances)
+    columns = {}
+    for key in NUMERIC_COLUMNS:
+        try:
+            columns[key] = np.fromiter((a[key] for a in appliances), dtype=np.float64, count=count)
+        except (KeyError, TypeError, ValueError):
+            # Malformed records are skipped later by preprocessing; keep them as NaN here.
+            columns[key] = np.array([_as_float(a.get(key)) for a in appliances], dtype=np.float64)
+    for key in CATEGORICAL_COLUMNS:
+        columns[key] = np.array([a.get(key) for a in appliances], dtype=object)
+    return columns
+
+def _as_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
 
 class DataManager:
     def __init__(self):
@@ -11,7 +113,8 @@ class DataManager:
         """
         self.appliances = []
         self.current_file_path = None
-        logging.debug("DataManager initialized without initial data")
+        self._last_written_digest = None
+        logger.debug("DataManager initialized without initial data")
 
     def load_data_from_file(self, file_path):
         """
@@ -24,13 +127,22 @@ class DataManager:
             bool: True if loading is successful, False otherwise.
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                self.appliances = json.load(f)
+            if ijson is not None and os.path.getsize(file_path) > STREAM_PARSE_THRESHOLD_BYTES:
+                with open(file_path, 'rb') as f:
+                    self.appliances = list(ijson.items(f, 'item', use_float=True))
+            else:
+                with open(file_path, 'rb') as f:
+                    raw = f.read()
+                self.appliances = _loads(raw)
+            # Digest what _write_appliances would write for the loaded data (not
+            # the file's own bytes, whose formatting may differ), so saving
+            # unchanged data right after a load is skipped.
+            self._last_written_digest = _digest(_dumps(self.appliances))
             self.current_file_path = file_path
-            logging.debug(f"Loaded {len(self.appliances)} appliances from {file_path}")
+            logger.debug("Loaded %s appliances from %s", len(self.appliances), file_path)
             return True
         except Exception as e:
-            logging.error(f"Failed to load data from {file_path}: {str(e)}")
+            logger.error("Failed to load data from %s: %s", file_path, e)
             return False
 
     def delete_appliance_at_index(self, index):
@@ -44,23 +156,53 @@ class DataManager:
             bool: True if deletion is successful, False otherwise.
         """
         if not self.current_file_path:
-            logging.error("No JSON file loaded. Cannot delete appliance.")
+            logger.error("No JSON file loaded. Cannot delete appliance.")
             return False
 
         if index < 0 or index >= len(self.appliances):
-            logging.error(f"Invalid index {index} for deletion.")
+            logger.error("Invalid index %s for deletion.", index)
             return False
 
         try:
             self.appliances.pop(index)
-            with open(self.current_file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.appliances, f, indent=4)
-            logging.debug(f"Deleted appliance at index {index} from {self.current_file_path}")
+            self._write_appliances()
+            logger.debug("Deleted appliance at index %s from %s", index, self.current_file_path)
             return True
         except Exception as e:
-            logging.error(f"Failed to delete appliance at index {index}: {str(e)}")
+            logger.error("Failed to delete appliance at index %s: %s", index, e)
+            return False
+
+    def _write_appliances(self):
+        """
+        Atomically write the appliances list to the current JSON file.
+
+        The data is written to a temporary file next to the target and moved into
+        place with os.replace, so a crash mid-write never leaves a truncated file.
+        The write is skipped when the serialized content matches what was last
+        read or written.
+
+        Returns:
+            bool: True if the file was written, False if it was already up to date.
+        """
+        data = _dumps(self.appliances)
+        digest = _digest(data)
+        if digest == self._last_written_digest:
             return False
 
+        tmp_path = self.current_file_path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.current_file_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._last_written_digest = digest
+        return True
+
     def get_appliances(self):
         """
         Get the list of appliances.
@@ -80,11 +222,12 @@ class DataManager:
         self.appliances = appliances
         if self.current_file_path:
             try:
-                with open(self.current_file_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.appliances, f, indent=4)
-                logging.debug(f"Updated {self.current_file_path} with {len(appliances)} appliances")
+                if self._write_appliances():
+                    logger.debug("Updated %s with %s appliances", self.current_file_path, len(appliances))
+                else:
+                    logger.debug("%s already up to date, skipped write", self.current_file_path)
             except Exception as e:
-                logging.error(f"Failed to update {self.current_file_path}: {str(e)}")
+                logger.error("Failed to update %s: %s", self.current_file_path, e)
         else:
-            logging.warning("No JSON file loaded. Appliances updated in memory only.")
-        logging.debug(f"Updated appliances list with {len(appliances)} items")
\ No newline at end of file
+            logger.warning("No JSON file loaded. Appliances updated in memory only.")
+        logger.debug("Updated appliances list with %s items", len(appliances))
@@ -1,66 +1,330 @@
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QLabel, QPushButton, QHBoxLayout, QTableWidget, QTableWidgetItem,
-    QMessageBox, QTextEdit, QScrollArea, QGroupBox, QDialog, QApplication, QSpinBox, QTimeEdit, QFormLayout, QCheckBox
+    QWidget, QVBoxLayout, QLabel, QPushButton, QHBoxLayout, QTableView,
+    QMessageBox, QScrollArea, QGroupBox, QDialog, QApplication, QSpinBox, QTimeEdit, QFormLayout, QCheckBox
 )
-from PyQt5.QtCore import Qt, pyqtSignal, QTime
-from PyQt5.QtGui import QFont
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot, QTime, QTimer, QAbstractTableModel, QModelIndex
+from PyQt5.QtGui import QFont, QFontDatabase
 import logging
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from collections import namedtuple
 import numpy as np
 
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+_BLUE_THEME = """
+    QWidget {
+        background-color: #94B4C1;
+        color: #ECEFCA;
+    }
+    QPushButton {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #547792, stop:1 #426b82);
+        color: #ECEFCA;
+        border: none;
+        padding: 12px 20px;
+        font-size: 12pt;
+        font-weight: bold;
+        border-radius: 10px;
+        font-family: Roboto, Arial;
+        margin: 10px;
+    }
+    QPushButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #94B4C1, stop:1 #547792);
+    }
+    QPushButton#prev_button, QPushButton#next_button {
+        padding: 8px;
+    }
+    QPushButton#save_return_time_button, QPushButton#simulate_button {
+        padding: 4px 8px;
+        font-size: 10pt;
+        margin: 2px;
+    }
+    #monthly_bill_label, #location_label, #temp_label, #humidity_label, #date_label {
+        background-color: #213448;
+        font-size: 11pt;
+        font-weight: bold;
+        padding: 6px;
+        border: 1px solid #213448;
+        border-radius: 6px;
+        font-family: Roboto, Arial;
+    }
+    #profile_info_scroll {
+        border-radius: 8px;
+        margin: 10px;
+    }
+    #profile_info {
+        background-color: #547792;
+        padding: 6px;
+        font-family: Roboto, Arial;
+        font-size: 10pt;
+        font-weight: bold;
+    }
+    QTableView, QTableView:disabled, QTableCornerButton::section, QScrollArea {
+        background-color: #547792;
+        color: #ECEFCA;
+        border: 1px solid #547792;
+    }
+    QTableView {
+        gridline-color: #213448;
+        font-size: 10pt;
+        font-family: Roboto, Arial;
+        alternate-background-color: #547792;
+    }
+    QTableView::item, QTableView::item:disabled {
+        color: #ECEFCA;
+        border: 1px solid #213448;
+    }
+    QTableView::item {
+        padding: 4px;
+    }
+    QHeaderView::section, QHeaderView::section:disabled {
+        background-color: #547792;
+        color: #ECEFCA;
+    }
+    QHeaderView::section {
+        padding: 6px;
+        border: none;
+        font-size: 10pt;
+        font-family: Roboto, Arial;
+    }
+    QGroupBox {
+        font-size: 12pt;
+        font-weight: bold;
+        margin-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        padding: 0 3px;
+    }
+    QGroupBox#owner_status_group, QGroupBox#owner_status_group QLabel, QCheckBox {
+        font-size: 10pt;
+    }
+    QTimeEdit#return_time_edit {
+        min-width: 80px;
+        font-size: 10pt;
+    }
+    #ac_label, #heater_label, #dehumidifier_label, #water_heater_label {
+        color: #000000;
+        font-size: 11pt;
+        font-family: Roboto, Arial;
+        padding: 4px;
+    }
+"""
+
+_GRAPH_QSS = """
+    QDialog#usage_graph_dialog QPushButton {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #547792, stop:1 #426b82);
+        color: #ECEFCA;
+        border: none;
+        padding: 8px 16px;
+        font-size: 12pt;
+        font-weight: bold;
+        border-radius: 8px;
+        font-family: Roboto, Arial;
+    }
+    QDialog#usage_graph_dialog QPushButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #94B4C1, stop:1 #547792);
+    }
+"""
+
+_SETTINGS_QSS = """
+    QDialog#settings_dialog {
+        background-color: #94B4C1;
+        color: #ECEFCA;
+        font-family: Roboto, Arial;
+        border: 1px solid #213448;
+        border-radius: 10px;
+    }
+    QDialog#settings_dialog QLabel {
+        font-size: 14pt;
+        color: #ECEFCA;
+    }
+    QDialog#settings_dialog QGroupBox {
+        font-size: 16pt;
+        font-weight: bold;
+        color: #ECEFCA;
+        border: 1px solid #547792;
+        border-radius: 8px;
+        margin-top: 20px;
+        padding: 10px;
+    }
+    QDialog#settings_dialog QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        padding: 5px 10px;
+    }
+    QDialog#settings_dialog QSpinBox, QDialog#settings_dialog QTimeEdit {
+        background-color: #547792;
+        color: #ECEFCA;
+        border: 1px solid #213448;
+        border-radius: 5px;
+        padding: 5px;
+        font-size: 12pt;
+        min-width: 100px;
+    }
+    QDialog#settings_dialog QTimeEdit {
+        min-width: 120px;
+    }
+    QDialog#settings_dialog QSpinBox::up-button, QDialog#settings_dialog QSpinBox::down-button,
+    QDialog#settings_dialog QTimeEdit::up-button, QDialog#settings_dialog QTimeEdit::down-button {
+        background-color: #426b82;
+        border: none;
+        width: 16px;
+    }
+    QDialog#settings_dialog QSpinBox::up-button:hover, QDialog#settings_dialog QSpinBox::down-button:hover,
+    QDialog#settings_dialog QTimeEdit::up-button:hover, QDialog#settings_dialog QTimeEdit::down-button:hover {
+        background-color: #94B4C1;
+    }
+    QDialog#settings_dialog QSpinBox::up-arrow, QDialog#settings_dialog QSpinBox::down-arrow,
+    QDialog#settings_dialog QTimeEdit::up-arrow, QDialog#settings_dialog QTimeEdit::down-arrow {
+        width: 10px;
+        height: 10px;
+    }
+    QDialog#settings_dialog QPushButton {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #547792, stop:1 #426b82);
+        color: #ECEFCA;
+        border: none;
+        padding: 10px 20px;
+        font-size: 12pt;
+        font-weight: bold;
+        border-radius: 8px;
+        font-family: Roboto, Arial;
+    }
+    QDialog#settings_dialog QPushButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #94B4C1, stop:1 #547792);
+    }
+"""
+
+_PROFILES = ("Eco", "Balanced", "Comfort", "Normal")
+_SELECTED_APPLIANCES = ("Air Conditioner", "Heater", "Water Heater", "Dehumidifier")
+
+_stylesheet_applied = False
+_ui_font_family = None
+_font_cache = {}
+
+def _apply_app_stylesheet():
+    """Install the main theme and the dialog-scoped rules on the QApplication once; later calls are no-ops."""
+    global _stylesheet_applied
+    if _stylesheet_applied:
+        return
+    QApplication.instance().setStyleSheet(_BLUE_THEME + _SETTINGS_QSS + _GRAPH_QSS)
+    _stylesheet_applied = True
+
+def _get_ui_font_family():
+    """Return "Roboto" if installed, else "Arial"; the font database is queried once."""
+    global _ui_font_family
+    if _ui_font_family is None:
+        _ui_font_family = "Roboto" if "Roboto" in QFontDatabase().families() else "Arial"
+    return _ui_font_family
+
+def _ui_font(point_size, bold=False):
+    """Return the shared UI QFont for a size/weight, constructing each combination once."""
+    key = (point_size, bold)
+    font = _font_cache.get(key)
+    if font is None:
+        font = QFont(_get_ui_font_family(), point_size, QFont.Bold if bold else QFont.Normal)
+        _font_cache[key] = font
+    return font
+
+# Columnar view of the weekly appliance records: one 1-D array per field, row i
+# across all arrays describing the same record.
+WeeklyData = namedtuple("WeeklyData", ["device_type", "date", "is_on", "has_turn_on", "duration"])
+
+def weekly_data_from_records(records):
+    """
+    Convert appliance record dictionaries into columnar WeeklyData.
+
+    Args:
+        records (list): Appliance dictionaries with "Device Type", "Date",
+            "On/Off Status", "Turn On Time" and "Usage Duration (minutes)".
+
+    Returns:
+        WeeklyData: One NumPy array per field, in record order.
+    """
+    count = len(records)
+    return WeeklyData(
+        device_type=np.array([r["Device Type"] for r in records], dtype=object),
+        date=np.array([r["Date"] for r in records], dtype=object),
+        is_on=np.fromiter((r["On/Off Status"] == "On" for r in records), dtype=bool, count=count),
+        has_turn_on=np.fromiter((r["Turn On Time"] != "N/A" for r in records), dtype=bool, count=count),
+        duration=np.fromiter((r["Usage Duration (minutes)"] for r in records), dtype=np.float32, count=count),
+    )
+
+def _aggregate_usage(device_idx, date_idx, on_mask, has_turn_on, durations, appliance_index, n_dates):
+    """
+    Usage minutes per date for one appliance.
+
+    The first "On" record of the appliance on a date decides the value, which
+    stays 0 if that record has no turn-on time.
+
+    Args:
+        device_idx (numpy.ndarray): Appliance index of each record.
+        date_idx (numpy.ndarray): Date index of each record, -1 if outside the plotted dates.
+        on_mask (numpy.ndarray): Whether each record is switched on.
+        has_turn_on (numpy.ndarray): Whether each record has a turn-on time.
+        durations (numpy.ndarray): Usage duration of each record in minutes.
+        appliance_index (int): Appliance to aggregate.
+        n_dates (int): Number of plotted dates.
+
+    Returns:
+        numpy.ndarray: Usage duration in minutes, one float32 entry per date.
+    """
+    rows = np.flatnonzero(on_mask & (device_idx == appliance_index) & (date_idx >= 0))
+    _, first = np.unique(date_idx[rows], return_index=True)
+    rows = rows[first]
+    rows = rows[has_turn_on[rows]]
+    usage_data = np.zeros(n_dates, dtype=np.float32)
+    usage_data[date_idx[rows]] = durations[rows]
+    return usage_data
 
 class UsageGraphDialog(QDialog):
     def __init__(self, weekly_data, dates, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Weekly Usage Patterns")
         self.setFixedSize(800, 600)
+        self.setObjectName("usage_graph_dialog")
+        self._update_pending = False
+        if not isinstance(weekly_data, WeeklyData):
+            weekly_data = weekly_data_from_records(weekly_data)
         self.weekly_data = weekly_data
         self.dates = dates
 
-        self.appliances = sorted(set(item["Device Type"] for item in weekly_data))
+        appliances, device_idx = np.unique(weekly_data.device_type, return_inverse=True)
+        self.appliances = appliances.tolist()
         self.current_appliance_index = 0
+        self._device_idx = device_idx.astype(np.int32)
+
+        # Records whose date is not in `dates` get a date index of -1.
+        date_pos = {date: i for i, date in enumerate(dates)}
+        self._date_idx = np.fromiter(
+            (date_pos.get(date, -1) for date in weekly_data.date), dtype=np.int32, count=len(weekly_data.date)
+        )
 
         self.layout = QVBoxLayout()
-        self.figure, self.ax = plt.subplots(figsize=(8, 5))
+        # matplotlib is only needed once a graph is opened, so it is imported here
+        # rather than at module load.
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+
+        self.figure = Figure(figsize=(8, 5))
+        self.ax = self.figure.add_subplot()
         self.canvas = FigureCanvas(self.figure)
         self.layout.addWidget(self.canvas)
 
+        # Axes decoration is the same for every appliance; only the line data,
+        # legend text and title change on toggle.
+        x = np.arange(len(self.dates))
+        self.ax.set_xlabel("Day of the Week")
+        self.ax.set_ylabel("Usage Duration (minutes)")
+        self.ax.set_xticks(x)
+        self.ax.set_xticklabels([date[8:10] for date in self.dates])
+        self.ax.grid(True)
+        self._line, = self.ax.plot(x, np.zeros(len(self.dates)), marker='o', color='b')
+        self._legend = self.ax.legend([self._line], [""])
+
         self.toggle_button = QPushButton("Next Appliance")
-        self.toggle_button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #547792, stop:1 #426b82);
-                color: #ECEFCA;
-                border: none;
-                padding: 8px 16px;
-                font-size: 12pt;
-                font-weight: bold;
-                border-radius: 8px;
-                font-family: Roboto, Arial;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #94B4C1, stop:1 #547792);
-            }
-        """)
         self.toggle_button.clicked.connect(self.toggle_appliance)
 
         self.ok_button = QPushButton("OK")
-        self.ok_button.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #547792, stop:1 #426b82);
-                color: #ECEFCA;
-                border: none;
-                padding: 8px 16px;
-                font-size: 12pt;
-                font-weight: bold;
-                border-radius: 8px;
-                font-family: Roboto, Arial;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #94B4C1, stop:1 #547792);
-            }
-        """)
         self.ok_button.clicked.connect(self.accept)
 
         button_layout = QHBoxLayout()
@@ -71,132 +335,48 @@ class UsageGraphDialog(QDialog):
         self.setLayout(self.layout)
         self.update_graph()
 
+    @pyqtSlot()
     def toggle_appliance(self):
         self.current_appliance_index = (self.current_appliance_index + 1) % len(self.appliances)
+        # Rapid clicks only advance the index; one redraw runs once the event loop is idle.
+        if not self._update_pending:
+            self._update_pending = True
+            QTimer.singleShot(0, self._run_pending_update)
+
+    def _run_pending_update(self):
+        self._update_pending = False
         self.update_graph()
 
+    def _daily_usage(self, appliance_index):
+        return _aggregate_usage(
+            self._device_idx, self._date_idx, self.weekly_data.is_on, self.weekly_data.has_turn_on,
+            self.weekly_data.duration, appliance_index, len(self.dates)
+        )
+
     def update_graph(self):
-        self.ax.clear()
         current_appliance = self.appliances[self.current_appliance_index]
-        usage_data = [0.0] * len(self.dates)
-        hours = [0] * len(self.dates)
-
-        for i, date in enumerate(self.dates):
-            daily_data = [item for item in self.weekly_data if item["Date"] == date]
-            for item in daily_data:
-                if item["Device Type"] == current_appliance and item["On/Off Status"] == "On":
-                    turn_on = item["Turn On Time"]
-                    if turn_on != "N/A":
-                        hour = int(turn_on.split(":")[0])
-                        hours[i] = hour
-                        usage_data[i] = item["Usage Duration (minutes)"]
-                    break
+        usage_data = self._daily_usage(self.current_appliance_index)
 
-        x = np.arange(len(self.dates))
-        self.ax.plot(x, usage_data, label=current_appliance, marker='o', color='b')
-        self.ax.set_xlabel("Day of the Week")
-        self.ax.set_ylabel("Usage Duration (minutes)")
+        self._line.set_ydata(usage_data)
+        self._line.set_label(current_appliance)
+        self._legend.get_texts()[0].set_text(current_appliance)
         self.ax.set_title(f"Weekly Usage Pattern - {current_appliance} ({self.dates[0]} to {self.dates[-1]})")
-        self.ax.set_xticks(x)
-        self.ax.set_xticklabels([date.split('-')[2] for date in self.dates])
-        self.ax.legend()
-        self.ax.grid(True)
-        self.canvas.draw()
+        self.ax.relim()
+        self.ax.autoscale_view(scalex=False)
+        self.canvas.draw_idle()
 
 class SettingsDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Settings")
         self.setFixedSize(600, 700)
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #94B4C1;
-                color: #ECEFCA;
-                font-family: Roboto, Arial;
-                border: 1px solid #213448;
-                border-radius: 10px;
-            }
-            QLabel {
-                font-size: 14pt;
-                color: #ECEFCA;
-            }
-            QGroupBox {
-                font-size: 16pt;
-                font-weight: bold;
-                color: #ECEFCA;
-                border: 1px solid #547792;
-                border-radius: 8px;
-                margin-top: 20px;
-                padding: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 5px 10px;
-            }
-            QSpinBox, QTimeEdit {
-                background-color: #547792;
-                color: #ECEFCA;
-                border: 1px solid #213448;
-                border-radius: 5px;
-                padding: 5px;
-                font-size: 12pt;
-                min-width: 100px;
-            }
-            QTimeEdit {
-                min-width: 120px;
-            }
-            QSpinBox::up-button, QSpinBox::down-button,
-            QTimeEdit::up-button, QTimeEdit::down-button {
-                background-color: #426b82;
-                border: none;
-                width: 16px;
-            }
-            QSpinBox::up-button:hover, QSpinBox::down-button:hover,
-            QTimeEdit::up-button:hover, QTimeEdit::down-button:hover {
-                background-color: #94B4C1;
-            }
-            QSpinBox::up-arrow, QSpinBox::down-arrow,
-            QTimeEdit::up-arrow, QTimeEdit::down-arrow {
-                width: 10px;
-                height: 10px;
-            }
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #547792, stop:1 #426b82);
-                color: #ECEFCA;
-                border: none;
-                padding: 10px 20px;
-                font-size: 12pt;
-                font-weight: bold;
-                border-radius: 8px;
-                font-family: Roboto, Arial;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #94B4C1, stop:1 #547792);
-            }
-        """)
+        self.setObjectName("settings_dialog")
 
         layout = QVBoxLayout()
         layout.setSpacing(20)
         layout.setContentsMargins(30, 30, 30, 30)
 
         temp_group = QGroupBox("Temperature Thresholds")
-        temp_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 16pt;
-                font-weight: bold;
-                color: #ECEFCA;
-                border: 1px solid #547792;
-                border-radius: 8px;
-                margin-top: 20px;
-                padding: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 5px 10px;
-            }
-        """)
         temp_form = QFormLayout()
         temp_form.setLabelAlignment(Qt.AlignRight)
         temp_form.setSpacing(15)
@@ -217,29 +397,12 @@ class SettingsDialog(QDialog):
         layout.addWidget(temp_group)
 
         time_group = QGroupBox("Turn-On Before Home (Minutes)")
-        time_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 16pt;
-                font-weight: bold;
-                color: #ECEFCA;
-                border: 1px solid #547792;
-                border-radius: 8px;
-                margin-top: 20px;
-                padding: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 5px 10px;
-            }
-        """)
         time_form = QFormLayout()
         time_form.setLabelAlignment(Qt.AlignRight)
         time_form.setSpacing(15)
 
         self.turn_on_before = {}
-        selected_appliances = ["Air Conditioner", "Heater", "Water Heater", "Dehumidifier"]
-        for appliance in selected_appliances:
+        for appliance in _SELECTED_APPLIANCES:
             spinbox = QSpinBox()
             spinbox.setRange(0, 120)
             spinbox.setValue(30)
@@ -250,22 +413,6 @@ class SettingsDialog(QDialog):
         layout.addWidget(time_group)
 
         turn_off_group = QGroupBox("Turn-Off Settings")
-        turn_off_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 16pt;
-                font-weight: bold;
-                color: #ECEFCA;
-                border: 1px solid #547792;
-                border-radius: 8px;
-                margin-top: 20px;
-                padding: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 5px 10px;
-            }
-        """)
         turn_off_form = QFormLayout()
         turn_off_form.setLabelAlignment(Qt.AlignRight)
         turn_off_form.setSpacing(15)
@@ -310,6 +457,93 @@ class SettingsDialog(QDialog):
         }
         return settings
 
+# (appliance key, formatted as a 2-decimal number) for every column except "Usage Adjusted"
+_TABLE_COLUMNS = (
+    ("Device Type", False),
+    ("Power Consumption (W)", True),
+    ("Room Location", False),
+    ("Temperature (°C)", True),
+    ("Humidity (%)", True),
+    ("Usage Duration (minutes)", True),
+    ("On/Off Status", False),
+    ("Turn On Time", False),
+)
+_TABLE_HEADERS = (
+    "Device Type", "Power (W)", "Room", "Temp (°C)", "Humidity (%)",
+    "Duration (min)", "Status", "Turn On Time", "Usage Adjusted"
+)
+_COLUMN_WIDTHS = (250, 140, 180, 140, 140, 160, 120, 140, 120)
+
+class ApplianceTableModel(QAbstractTableModel):
+    """
+    Read-only table model over a list of appliance dictionaries.
+
+    Cell text is built column by column in set_rows(), so data() is a plain
+    lookup when the view paints.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._columns = [[] for _ in _TABLE_HEADERS]
+        self._row_count = 0
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(_TABLE_HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid():
+            return None
+        return self._columns[index.column()][index.row()]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return _TABLE_HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+    def set_rows(self, appliances, adjusted_indices=None):
+        """
+        Replace the displayed appliances.
+
+        Args:
+            appliances (list): List of appliance dictionaries, one per row.
+            adjusted_indices (iterable, optional): Rows whose usage was adjusted.
+        """
+        row_count = len(appliances)
+        columns = []
+        for key, numeric in _TABLE_COLUMNS:
+            if numeric:
+                values = np.fromiter((a[key] for a in appliances), dtype=np.float64, count=row_count)
+                columns.append(np.char.mod("%.2f", values).tolist())
+            else:
+                columns.append([a[key] for a in appliances])
+        adjusted = np.zeros(row_count, dtype=bool)
+        if adjusted_indices is not None:
+            adjusted[np.fromiter(adjusted_indices, dtype=np.intp)] = True
+        columns.append(np.where(adjusted, "Yes", "No").tolist())
+
+        if row_count == self._row_count:
+            # Same shape (typically another day of the same appliance set):
+            # refresh in place, repainting only the span of rows that differ.
+            changed = np.zeros(row_count, dtype=bool)
+            for new_column, old_column in zip(columns, self._columns):
+                changed |= np.asarray(new_column, dtype=object) != np.asarray(old_column, dtype=object)
+            self._columns = columns
+            changed_rows = np.flatnonzero(changed)
+            if changed_rows.size:
+                self.dataChanged.emit(
+                    self.index(int(changed_rows[0]), 0),
+                    self.index(int(changed_rows[-1]), len(_TABLE_HEADERS) - 1),
+                    [Qt.DisplayRole]
+                )
+            return
+
+        self.beginResetModel()
+        self._columns = columns
+        self._row_count = row_count
+        self.endResetModel()
+
 class EnergyCostPredictorGUI(QWidget):
     profile_changed = pyqtSignal(str)
     bill_update_requested = pyqtSignal(list)
@@ -322,8 +556,14 @@ class EnergyCostPredictorGUI(QWidget):
         super().__init__()
         self.load_dataset_callback = load_dataset_callback
         self.weekly_data = []
+        self._weekly_columns = None
+        self._by_date = {}
         self.dates = []
         self.current_day_index = 0
+        self._last_day_index = -1
+        self._force_refresh = False
+        self._bill_requested = False
+        self._last_monthly_bill = None
         self.init_ui()
 
     def init_ui(self):
@@ -335,138 +575,11 @@ class EnergyCostPredictorGUI(QWidget):
         
         self.move(0, (screen.height() - 1200) // 2)
 
-        font = QFont("Roboto", 11)
-        if not font.exactMatch():
-            font = QFont("Arial", 11)
-
-        blue_theme = """
-            QWidget {
-                background-color: #94B4C1;
-                color: #ECEFCA;
-            }
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #547792, stop:1 #426b82);
-                color: #ECEFCA;
-                border: none;
-                padding: 12px 20px;
-                font-size: 12pt;
-                font-weight: bold;
-                border-radius: 10px;
-                font-family: Roboto, Arial;
-                box-shadow: 0px 2px 5px rgba(0, 0, 0, 0.2);
-                margin: 10px;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, stop:0 #94B4C1, stop:1 #547792);
-            }
-            QPushButton#prev_button, QPushButton#next_button {
-                padding: 8px;
-                font-size: 12pt;
-            }
-            QPushButton#save_return_time_button, QPushButton#simulate_button {
-                padding: 4px 8px;
-                font-size: 10pt;
-                margin: 2px;
-            }
-            #monthly_bill_label, #location_label, #temp_label, #humidity_label, #date_label {
-                background-color: #213448;
-                color: #ECEFCA;
-                font-size: 11pt;
-                font-weight: bold;
-                padding: 6px;
-                border: 1px solid #213448;
-                border-radius: 6px;
-                font-family: Roboto, Arial;
-            }
-            QTextEdit {
-                background-color: #547792;
-                border: 1px solid #547792;
-                border-radius: 8px;
-                padding: 6px;
-                font-family: Roboto, Arial;
-                font-size: 10pt;
-                margin: 10px;
-            }
-            #profile_info {
-                color: #ECEFCA;
-                font-weight: bold;
-            }
-            QTableWidget {
-                background-color: #547792;
-                color: #ECEFCA;
-                border: 1px solid #547792;
-                gridline-color: #213448;
-                font-size: 10pt;
-                font-family: Roboto, Arial;
-                alternate-background-color: #547792;
-            }
-            QTableWidget:disabled {
-                background-color: #547792;
-                color: #ECEFCA;
-                border: 1px solid #547792;
-            }
-            QTableWidget::item {
-                padding: 4px;
-                color: #ECEFCA;
-                border: 1px solid #213448;
-            }
-            QTableWidget::item:disabled {
-                color: #ECEFCA;
-                border: 1px solid #213448;
-            }
-            QHeaderView::section {
-                background-color: #547792;
-                color: #ECEFCA;
-                padding: 6px;
-                border: none;
-                font-size: 10pt;
-                font-family: Roboto, Arial;
-            }
-            QHeaderView::section:disabled {
-                background-color: #547792;
-                color: #ECEFCA;
-            }
-            QTableCornerButton::section {
-                background-color: #547792;
-                border: 1px solid #547792;
-            }
-            QScrollArea {
-                background-color: #547792;
-                border: 1px solid #547792;
-            }
-            QGroupBox {
-                font-size: 12pt;
-                font-weight: bold;
-                color: #ECEFCA;
-                margin-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top left;
-                padding: 0 3px;
-            }
-            QGroupBox#owner_status_group {
-                font-size: 10pt;
-            }
-            QGroupBox#owner_status_group QLabel {
-                font-size: 10pt;
-            }
-            QCheckBox {
-                font-size: 10pt;
-                color: #ECEFCA;
-            }
-            QTimeEdit#return_time_edit {
-                min-width: 80px;
-                font-size: 10pt;
-            }
-            #ac_label, #heater_label, #dehumidifier_label, #water_heater_label {
-                color: #000000;
-                font-size: 11pt;
-                font-family: Roboto, Arial;
-                padding: 4px;
-            }
-        """
-        self.setStyleSheet(blue_theme)
+        button_font = _ui_font(12, bold=True)
+        label_bold_font = _ui_font(11, bold=True)
+        label_font = _ui_font(11)
+
+        _apply_app_stylesheet()
 
         main_layout = QVBoxLayout()
         main_layout.setSpacing(30)
@@ -476,130 +589,67 @@ class EnergyCostPredictorGUI(QWidget):
         button_layout.setSpacing(10)
         button_layout.addStretch(1)
 
-        load_button = QPushButton("Load Appliances")
-        load_button.setFont(QFont("Roboto", 12, QFont.Bold))
-        if not load_button.font().exactMatch():
-            load_button.setFont(QFont("Arial", 12, QFont.Bold))
-        load_button.setCursor(Qt.PointingHandCursor)
-        load_button.clicked.connect(self.load_dataset_callback)
-        button_layout.addWidget(load_button)
-
-        self.prev_button = QPushButton("◄")
-        self.prev_button.setFont(QFont("Roboto", 12, QFont.Bold))
-        if not self.prev_button.font().exactMatch():
-            self.prev_button.setFont(QFont("Arial", 12, QFont.Bold))
+        button_layout.addWidget(
+            self._make_button("Load Appliances", button_font, self.load_dataset_callback, pointing_cursor=True)
+        )
+
+        self.prev_button = self._make_button("◄", button_font, self.prev_day)
         self.prev_button.setFixedWidth(40)
-        self.prev_button.clicked.connect(self.prev_day)
         button_layout.addWidget(self.prev_button)
 
-        self.date_label = QLabel("Date: N/A")
-        self.date_label.setFont(QFont("Roboto", 11, QFont.Bold))
-        if not self.date_label.font().exactMatch():
-            self.date_label.setFont(QFont("Arial", 11, QFont.Bold))
-        self.date_label.setObjectName("date_label")
+        self.date_label = self._make_label("Date: N/A", label_bold_font, "date_label")
         button_layout.addWidget(self.date_label)
 
-        self.next_button = QPushButton("►")
-        self.next_button.setFont(QFont("Roboto", 12, QFont.Bold))
-        if not self.next_button.font().exactMatch():
-            self.next_button.setFont(QFont("Arial", 12, QFont.Bold))
+        self.next_button = self._make_button("►", button_font, self.next_day)
         self.next_button.setFixedWidth(40)
-        self.next_button.clicked.connect(self.next_day)
         button_layout.addWidget(self.next_button)
 
-        self.graph_button = QPushButton("Show Usage Graph")
-        self.graph_button.setFont(QFont("Roboto", 12, QFont.Bold))
-        if not self.graph_button.font().exactMatch():
-            self.graph_button.setFont(QFont("Arial", 12, QFont.Bold))
-        self.graph_button.clicked.connect(self.show_usage_graph)
+        self.graph_button = self._make_button("Show Usage Graph", button_font, self.show_usage_graph)
         button_layout.addWidget(self.graph_button)
 
-        self.update_model_button = QPushButton("Check for Model Update")
-        self.update_model_button.setFont(QFont("Roboto", 12, QFont.Bold))
-        if not self.update_model_button.font().exactMatch():
-            self.update_model_button.setFont(QFont("Arial", 12, QFont.Bold))
-        self.update_model_button.setCursor(Qt.PointingHandCursor)
-        self.update_model_button.clicked.connect(self.check_model_update)
+        self.update_model_button = self._make_button(
+            "Check for Model Update", button_font, self.check_model_update, pointing_cursor=True
+        )
         button_layout.addWidget(self.update_model_button)
 
-        self.settings_button = QPushButton("Settings ⚙️")
-        self.settings_button.setFont(QFont("Roboto", 12, QFont.Bold))
-        if not self.settings_button.font().exactMatch():
-            self.settings_button.setFont(QFont("Arial", 12, QFont.Bold))
-        self.settings_button.setCursor(Qt.PointingHandCursor)
-        self.settings_button.clicked.connect(self.open_settings)
+        self.settings_button = self._make_button("Settings ⚙️", button_font, self.open_settings, pointing_cursor=True)
         button_layout.addWidget(self.settings_button)
 
         button_layout.addStretch(1)
         main_layout.addLayout(button_layout)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(9)
-        self.table.setHorizontalHeaderLabels([
-            "Device Type", "Power (W)", "Room", "Temp (°C)", "Humidity (%)",
-            "Duration (min)", "Status", "Turn On Time", "Usage Adjusted"
-        ])
+        self.table_model = ApplianceTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
         self.table.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
         self.table.setCornerButtonEnabled(False)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.table.setSelectionMode(QTableWidget.NoSelection)
+        self.table.setEditTriggers(QTableView.NoEditTriggers)
+        self.table.setSelectionMode(QTableView.NoSelection)
         self.table.setFocusPolicy(Qt.NoFocus)
         self.table.setEnabled(False)
         self.table.verticalHeader().setDefaultSectionSize(32)
-        self.table.setColumnWidth(0, 250)
-        self.table.setColumnWidth(1, 140)
-        self.table.setColumnWidth(2, 180)
-        self.table.setColumnWidth(3, 140)
-        self.table.setColumnWidth(4, 140)
-        self.table.setColumnWidth(5, 160)
-        self.table.setColumnWidth(6, 120)
-        self.table.setColumnWidth(7, 140)
-        self.table.setColumnWidth(8, 120)
+        header = self.table.horizontalHeader()
+        for column, width in enumerate(_COLUMN_WIDTHS):
+            header.resizeSection(column, width)
         self.table.setAlternatingRowColors(True)
 
-        scroll_area = QScrollArea()
-        scroll_area.setFixedHeight(400)
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setWidget(self.table)
-        main_layout.addWidget(scroll_area)
+        self.table.setFixedHeight(400)
+        main_layout.addWidget(self.table)
 
         profile_layout = QHBoxLayout()
         profile_layout.setSpacing(10)
         profile_layout.setAlignment(Qt.AlignCenter)
 
-        eco_button = QPushButton("Eco")
-        eco_button.setFont(QFont("Roboto", 12, QFont.Bold))
-        if not eco_button.font().exactMatch():
-            eco_button.setFont(QFont("Arial", 12, QFont.Bold))
-        eco_button.setCursor(Qt.PointingHandCursor)
-        eco_button.clicked.connect(lambda: self.profile_changed.emit("Eco"))
-        profile_layout.addWidget(eco_button)
-
-        balanced_button = QPushButton("Balanced")
-        balanced_button.setFont(QFont("Roboto", 12, QFont.Bold))
-        if not balanced_button.font().exactMatch():
-            balanced_button.setFont(QFont("Arial", 12, QFont.Bold))
-        balanced_button.setCursor(Qt.PointingHandCursor)
-        balanced_button.clicked.connect(lambda: self.profile_changed.emit("Balanced"))
-        profile_layout.addWidget(balanced_button)
-
-        comfort_button = QPushButton("Comfort")
-        comfort_button.setFont(QFont("Roboto", 12, QFont.Bold))
-        if not comfort_button.font().exactMatch():
-            comfort_button.setFont(QFont("Arial", 12, QFont.Bold))
-        comfort_button.setCursor(Qt.PointingHandCursor)
-        comfort_button.clicked.connect(lambda: self.profile_changed.emit("Comfort"))
-        profile_layout.addWidget(comfort_button)
-
-        normal_button = QPushButton("Normal")
-        normal_button.setFont(QFont("Roboto", 12, QFont.Bold))
-        if not normal_button.font().exactMatch():
-            normal_button.setFont(QFont("Arial", 12, QFont.Bold))
-        normal_button.setCursor(Qt.PointingHandCursor)
-        normal_button.clicked.connect(lambda: self.profile_changed.emit("Normal"))
-        profile_layout.addWidget(normal_button)
+        for profile_name in _PROFILES:
+            profile_button = self._make_button(
+                profile_name,
+                button_font,
+                self._on_profile_clicked,
+                pointing_cursor=True
+            )
+            profile_layout.addWidget(profile_button)
 
         main_layout.addLayout(profile_layout)
 
@@ -612,25 +662,13 @@ class EnergyCostPredictorGUI(QWidget):
         weather_vertical_layout = QVBoxLayout()
         weather_vertical_layout.setSpacing(5)
 
-        self.location_label = QLabel("🌍 Location: N/A")
-        self.location_label.setFont(QFont("Roboto", 11, QFont.Bold))
-        if not self.location_label.font().exactMatch():
-            self.location_label.setFont(QFont("Arial", 11, QFont.Bold))
-        self.location_label.setObjectName("location_label")
+        self.location_label = self._make_label("🌍 Location: N/A", label_bold_font, "location_label")
         weather_vertical_layout.addWidget(self.location_label)
 
-        self.temp_label = QLabel("🌡️ Temperature: N/A")
-        self.temp_label.setFont(QFont("Roboto", 11, QFont.Bold))
-        if not self.temp_label.font().exactMatch():
-            self.temp_label.setFont(QFont("Arial", 11, QFont.Bold))
-        self.temp_label.setObjectName("temp_label")
+        self.temp_label = self._make_label("🌡️ Temperature: N/A", label_bold_font, "temp_label")
         weather_vertical_layout.addWidget(self.temp_label)
 
-        self.humidity_label = QLabel("💧 Humidity: N/A")
-        self.humidity_label.setFont(QFont("Roboto", 11, QFont.Bold))
-        if not self.humidity_label.font().exactMatch():
-            self.humidity_label.setFont(QFont("Arial", 11, QFont.Bold))
-        self.humidity_label.setObjectName("humidity_label")
+        self.humidity_label = self._make_label("💧 Humidity: N/A", label_bold_font, "humidity_label")
         weather_vertical_layout.addWidget(self.humidity_label)
 
         weather_appliance_owner_layout.addLayout(weather_vertical_layout, 1)
@@ -640,32 +678,16 @@ class EnergyCostPredictorGUI(QWidget):
         appliance_layout = QVBoxLayout()
         appliance_layout.setSpacing(5)
 
-        self.ac_label = QLabel("<b>AC:</b> N/A")
-        self.ac_label.setFont(QFont("Roboto", 11))
-        if not self.ac_label.font().exactMatch():
-            self.ac_label.setFont(QFont("Arial", 11))
-        self.ac_label.setObjectName("ac_label")
+        self.ac_label = self._make_label("<b>AC:</b> N/A", label_font, "ac_label")
         appliance_layout.addWidget(self.ac_label)
 
-        self.heater_label = QLabel("<b>Heater:</b> N/A")
-        self.heater_label.setFont(QFont("Roboto", 11))
-        if not self.heater_label.font().exactMatch():
-            self.heater_label.setFont(QFont("Arial", 11))
-        self.heater_label.setObjectName("heater_label")
+        self.heater_label = self._make_label("<b>Heater:</b> N/A", label_font, "heater_label")
         appliance_layout.addWidget(self.heater_label)
 
-        self.dehumidifier_label = QLabel("<b>Dehumidifier:</b> N/A")
-        self.dehumidifier_label.setFont(QFont("Roboto", 11))
-        if not self.dehumidifier_label.font().exactMatch():
-            self.dehumidifier_label.setFont(QFont("Arial", 11))
-        self.dehumidifier_label.setObjectName("dehumidifier_label")
+        self.dehumidifier_label = self._make_label("<b>Dehumidifier:</b> N/A", label_font, "dehumidifier_label")
         appliance_layout.addWidget(self.dehumidifier_label)
 
-        self.water_heater_label = QLabel("<b>Water Heater:</b> Scheduled")
-        self.water_heater_label.setFont(QFont("Roboto", 11))
-        if not self.water_heater_label.font().exactMatch():
-            self.water_heater_label.setFont(QFont("Arial", 11))
-        self.water_heater_label.setObjectName("water_heater_label")
+        self.water_heater_label = self._make_label("<b>Water Heater:</b> Scheduled", label_font, "water_heater_label")
         appliance_layout.addWidget(self.water_heater_label)
 
         self.appliance_group.setLayout(appliance_layout)
@@ -696,7 +718,7 @@ class EnergyCostPredictorGUI(QWidget):
         return_time_layout.addWidget(self.save_return_time_button)
 
         self.owner_status_label = QLabel("Time left: N/A")
-        self.owner_status_label.setFont(QFont("Arial", 10))
+        self.owner_status_label.setFont(_ui_font(10))
 
         self.simulate_button = QPushButton("Simulate")
         self.simulate_button.setObjectName("simulate_button")
@@ -713,24 +735,40 @@ class EnergyCostPredictorGUI(QWidget):
         weather_appliance_owner_layout.addStretch(1)
         main_layout.addLayout(weather_appliance_owner_layout)
 
-        self.profile_info = QTextEdit()
+        self.profile_info = QLabel("Select a profile to view usage time limits.")
         self.profile_info.setObjectName("profile_info")
-        self.profile_info.setReadOnly(True)
-        self.profile_info.setFixedHeight(120)
-        self.profile_info.setText("Select a profile to view usage time limits.")
-        main_layout.addWidget(self.profile_info)
-
-        self.monthly_bill_label = QLabel("Predicted Monthly Bill: $0.00")
-        self.monthly_bill_label.setFont(QFont("Roboto", 11, QFont.Bold))
-        if not self.monthly_bill_label.font().exactMatch():
-            self.monthly_bill_label.setFont(QFont("Arial", 11, QFont.Bold))
+        self.profile_info.setTextFormat(Qt.PlainText)
+        self.profile_info.setWordWrap(True)
+        self.profile_info.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.profile_info.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        profile_info_scroll = QScrollArea()
+        profile_info_scroll.setObjectName("profile_info_scroll")
+        profile_info_scroll.setFixedHeight(120)
+        profile_info_scroll.setWidgetResizable(True)
+        profile_info_scroll.setWidget(self.profile_info)
+        main_layout.addWidget(profile_info_scroll)
+
+        self.monthly_bill_label = self._make_label("Predicted Monthly Bill: $0.00", label_bold_font, "monthly_bill_label")
         self.monthly_bill_label.setAlignment(Qt.AlignCenter)
-        self.monthly_bill_label.setObjectName("monthly_bill_label")
         main_layout.addWidget(self.monthly_bill_label, alignment=Qt.AlignCenter)
 
         main_layout.addStretch(1)
         self.setLayout(main_layout)
-        logging.debug("GUI components initialized with full-width and 1200px height layout, with settings button")
+        logger.debug("GUI components initialized with full-width and 1200px height layout, with settings button")
+
+    def _make_button(self, text, font, slot, pointing_cursor=False):
+        button = QPushButton(text)
+        button.setFont(font)
+        if pointing_cursor:
+            button.setCursor(Qt.PointingHandCursor)
+        button.clicked.connect(slot)
+        return button
+
+    def _make_label(self, text, font, object_name):
+        label = QLabel(text)
+        label.setFont(font)
+        label.setObjectName(object_name)
+        return label
 
     def update_weather(self, location, temperature, humidity, settings=None):
         if location is not None:
@@ -767,65 +805,90 @@ class EnergyCostPredictorGUI(QWidget):
 
         self.water_heater_label.setText("<b>Water Heater:</b> Scheduled")
 
-        logging.debug(f"Updated weather display: location={location}, temp={temperature}, humidity={humidity}")
+        logger.debug("Updated weather display: location=%s, temp=%s, humidity=%s", location, temperature, humidity)
 
     def populate_dropdowns(self, device_options, room_options):
-        logging.debug("Dropdowns populated with device and room options (no-op)")
+        logger.debug("Dropdowns populated with device and room options (no-op)")
 
     def set_weekly_data(self, appliances):
         self.weekly_data = appliances
-        self.dates = sorted(list(set(item["Date"] for item in appliances)))
+        self._weekly_columns = None
+        self._by_date = {}
+        for item in appliances:
+            self._by_date.setdefault(item["Date"], []).append(item)
+        self.dates = sorted(self._by_date)
         self.current_day_index = 0
+        self._force_refresh = True
+        self._bill_requested = False
         if self.dates:
             self.update_day_display()
 
     def update_day_display(self):
         if not self.dates:
             return
+        if self.current_day_index == self._last_day_index and not self._force_refresh:
+            return
+        self._last_day_index = self.current_day_index
+        self._force_refresh = False
         current_date = self.dates[self.current_day_index]
         self.date_label.setText(f"Date: {current_date}")
-        daily_data = [item for item in self.weekly_data if item["Date"] == current_date]
+        daily_data = self._by_date[current_date]
         self.populate_table(daily_data)
 
-        self.bill_update_requested.emit(daily_data)
+        # The displayed bill covers the whole week, so one request per loaded
+        # week is enough; later profile/data changes push their own updates.
+        if not self._bill_requested:
+            self._bill_requested = True
+            self.bill_update_requested.emit(daily_data)
 
         self.prev_button.setEnabled(self.current_day_index > 0)
         self.next_button.setEnabled(self.current_day_index < len(self.dates) - 1)
 
+    @pyqtSlot()
+    def _on_profile_clicked(self):
+        self.profile_changed.emit(self.sender().text())
+
+    @pyqtSlot()
     def prev_day(self):
         if self.current_day_index > 0:
             self.current_day_index -= 1
             self.update_day_display()
 
+    @pyqtSlot()
     def next_day(self):
         if self.current_day_index < len(self.dates) - 1:
             self.current_day_index += 1
             self.update_day_display()
 
+    @pyqtSlot()
     def show_usage_graph(self):
         if not self.dates:
             QMessageBox.warning(self, "Warning", "No data loaded.")
             return
-        dialog = UsageGraphDialog(self.weekly_data, self.dates, self)
+        if self._weekly_columns is None:
+            self._weekly_columns = weekly_data_from_records(self.weekly_data)
+        dialog = UsageGraphDialog(self._weekly_columns, self.dates, self)
         dialog.exec_()
 
+    def begin_bulk(self):
+        """Suspend table repaints; every refill must pair this with end_bulk()."""
+        self.table.setUpdatesEnabled(False)
+
+    def end_bulk(self):
+        self.table.setUpdatesEnabled(True)
+        self.table.viewport().update()
+
     def populate_table(self, appliances, daily_costs=None, adjusted_indices=None):
-        adjusted_indices = adjusted_indices or []
-        self.table.setRowCount(len(appliances))
-        for row, appliance in enumerate(appliances):
-            self.table.setItem(row, 0, QTableWidgetItem(appliance["Device Type"]))
-            self.table.setItem(row, 1, QTableWidgetItem(f"{appliance['Power Consumption (W)']:.2f}"))
-            self.table.setItem(row, 2, QTableWidgetItem(appliance["Room Location"]))
-            self.table.setItem(row, 3, QTableWidgetItem(f"{appliance['Temperature (°C)']:.2f}"))
-            self.table.setItem(row, 4, QTableWidgetItem(f"{appliance['Humidity (%)']:.2f}"))
-            self.table.setItem(row, 5, QTableWidgetItem(f"{appliance['Usage Duration (minutes)']:.2f}"))
-            self.table.setItem(row, 6, QTableWidgetItem(appliance["On/Off Status"]))
-            self.table.setItem(row, 7, QTableWidgetItem(appliance["Turn On Time"]))
-            usage_adjusted = "Yes" if row in adjusted_indices else "No"
-            self.table.setItem(row, 8, QTableWidgetItem(usage_adjusted))
-
-        logging.debug(f"Table populated with {len(appliances)} appliances")
+        self.begin_bulk()
+        try:
+            self.table_model.set_rows(appliances, adjusted_indices)
+        finally:
+            self.end_bulk()
+        logger.debug("Table populated with %d appliances", len(appliances))
 
     def update_monthly_bill(self, monthly_bill):
+        if monthly_bill == self._last_monthly_bill:
+            return
+        self._last_monthly_bill = monthly_bill
         self.monthly_bill_label.setText(f"Predicted Monthly Bill: ${monthly_bill:.2f}")
-        logging.debug(f"Updated monthly bill display: ${monthly_bill:.2f}")
\ No newline at end of file
+        logger.debug("Updated monthly bill display: $%.2f", monthly_bill)
\ No newline at end of file
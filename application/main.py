@@ -1,21 +1,43 @@
 import sys
 import os
-import copy
 import numpy as np
 from PyQt5.QtWidgets import QApplication, QMessageBox, QFileDialog
-from PyQt5.QtCore import QTimer, QTime
+from PyQt5.QtCore import QTimer, QTime, QObject, QRunnable, QThreadPool, pyqtSignal
 from model_loader import ModelLoader
-from preprocessor import preprocess_appliances
+from preprocessor import make_usage_rescaler
 from bill_calculator import BillCalculator
-from data_manager import DataManager
+from data_manager import DataManager, appliances_to_columns
 from gui_components import EnergyCostPredictorGUI, SettingsDialog
-import urllib.request
+import hashlib
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
 import pickle
 from google.cloud import storage
 from google.auth.credentials import AnonymousCredentials
 
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+MODEL_BUCKET_URL = "https://storage.googleapis.com/big_data32"
+MODEL_CHECK_WORKERS = 8
+MODEL_CHECK_TIMEOUT = 5
+MODEL_LISTING_TTL = 60
+MODEL_DOWNLOAD_TIMEOUT = (5, 30)
+MODEL_DOWNLOAD_CHUNK_BYTES = 1 << 20
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+def configure_logging():
+    """
+    Configure logging once for the whole application.
+
+    The level defaults to DEBUG and can be raised through the
+    ENERGY_APP_LOG_LEVEL environment variable (e.g. WARNING in production).
+    """
+    level_name = os.environ.get("ENERGY_APP_LOG_LEVEL", "DEBUG").upper()
+    level = getattr(logging, level_name, logging.DEBUG)
+    logging.basicConfig(level=level, format=LOG_FORMAT, force=True)
 
 def get_base_path():
     if getattr(sys, 'frozen', False):
@@ -24,6 +46,27 @@ def get_base_path():
         script_dir = os.path.dirname(os.path.abspath(__file__))
         return os.path.dirname(script_dir)
 
+class _DatasetLoadSignals(QObject):
+    loaded = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+class _DatasetLoadWorker(QRunnable):
+    """Runs a dataset-reading function on the thread pool and reports back through signals."""
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = _DatasetLoadSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            logger.error("Error loading dataset in background: %s", e)
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.loaded.emit(result)
+
 class EnergyCostPredictorApp:
     def __init__(self):
         self.app = QApplication(sys.argv)
@@ -91,12 +134,20 @@ class EnergyCostPredictorApp:
             }
         }
 
+        self._profile_index, self._factor_column, self._profile_factor_matrix = self._build_profile_factor_matrix()
+
         self.gui = EnergyCostPredictorGUI(self.load_dataset)
         self.gui.populate_dropdowns(
             list(self.model_loader.device_encoder.classes_),
             list(self.model_loader.room_encoder.classes_)
         )
-        self.gui.profile_changed.connect(self.change_profile)
+        # Profile clicks are debounced so a burst of clicks recomputes the bill once
+        self._pending_profile = None
+        self._profile_timer = QTimer()
+        self._profile_timer.setSingleShot(True)
+        self._profile_timer.setInterval(120)
+        self._profile_timer.timeout.connect(self._apply_pending_profile)
+        self.gui.profile_changed.connect(self._queue_profile_change)
         self.gui.bill_update_requested.connect(self.update_bill_for_day)
         self.gui.check_model_update.connect(self.check_for_model_update)
         self.gui.open_settings.connect(self.open_settings_dialog)
@@ -130,6 +181,9 @@ class EnergyCostPredictorApp:
         self.grace_countdown = 0
         self.return_time_passed = False
         self.saved_return_time = None  # Initially no saved return time
+        # Cleared once the "home" state has been applied; while the owner stays
+        # home every later tick would rewrite the same values, so it is skipped.
+        self._owner_status_dirty = True
 
         # Timer for owner status updates
         self.owner_status_timer = QTimer()
@@ -142,9 +196,17 @@ class EnergyCostPredictorApp:
         self.weather_timer.start(30 * 60 * 1000)
         self.current_model_folder = None
         self.current_profile = "Normal"
+        # Monthly bill per (profile, dataset token); the token is bumped whenever
+        # original_appliances or the model changes.
+        self._bill_cache = {}
+        self._dataset_token = 0
+        self._load_worker = None
+        self._http_session = None
+        self._folder_listing_cache = (0.0, None)
         self.gui.show()
 
         self.model_folders_file = os.path.join(get_base_path(), "model_folders.txt")
+        self._seen_folders = None
         if not os.path.exists(self.model_folders_file):
             with open(self.model_folders_file, 'w') as f:
                 f.write("")
@@ -152,31 +214,39 @@ class EnergyCostPredictorApp:
     def save_return_time_handler(self):
         """Handle the saving of the return time and trigger an immediate status update."""
         self.saved_return_time = self.gui.expected_return_time_edit.time()
-        logging.debug(f"Saved return time: {self.saved_return_time.toString('HH:mm')}")
+        self._owner_status_dirty = True
+        logger.debug("Saved return time: %s", self.saved_return_time.toString('HH:mm'))
         self.update_owner_status()
 
     def load_seen_folders(self):
-        seen_folders = set()
+        # Only save_seen_folders writes the file, so it is read once and the
+        # parsed set is kept in memory afterwards.
+        if self._seen_folders is not None:
+            return self._seen_folders
         try:
             with open(self.model_folders_file, 'r') as f:
-                for line in f:
-                    folder = line.strip()
-                    if folder:
-                        seen_folders.add(folder)
+                seen_folders = frozenset(line.strip() for line in f if line.strip())
         except Exception as e:
-            logging.error(f"Failed to read model_folders.txt: {str(e)}")
+            logger.error("Failed to read model_folders.txt: %s", e)
+            return frozenset()
+        self._seen_folders = seen_folders
         return seen_folders
 
     def save_seen_folders(self, seen_folders):
+        seen_folders = frozenset(seen_folders)
+        if seen_folders == self._seen_folders:
+            return
         try:
             with open(self.model_folders_file, 'w') as f:
-                for folder in sorted(seen_folders):
-                    f.write(f"{folder}\n")
+                f.writelines(f"{folder}\n" for folder in sorted(seen_folders))
         except Exception as e:
-            logging.error(f"Failed to write to model_folders.txt: {str(e)}")
+            logger.error("Failed to write to model_folders.txt: %s", e)
+            return
+        self._seen_folders = seen_folders
 
     def toggle_owner_home(self):
         self.owner_home = not self.owner_home
+        self._owner_status_dirty = True
         if self.owner_home:
             self.grace_countdown = 0
             self.return_time_passed = False
@@ -188,31 +258,37 @@ class EnergyCostPredictorApp:
     def reduce_appliance_power(self):
         if not hasattr(self, 'original_appliances') or not self.original_appliances:
             return
-        for appliance in self.original_appliances:
-            device_type = appliance["Device Type"]
-            if device_type != "Refrigerator":
-                original_usage = appliance["Usage Duration (minutes)"]
-                reduced_usage = original_usage * 0.5
-                appliance["Usage Duration (minutes)"] = reduced_usage
-                logging.debug(f"Reduced power for {device_type}: {original_usage} -> {reduced_usage} minutes")
+        # The usage column is what the bill is computed from, so it is halved in
+        # place; the rest of the index (encodings, scaled features) is unchanged.
+        reduced = self._columns["Device Type"] != "Refrigerator"
+        self._original_usage[reduced] *= 0.5
+        self._invalidate_bill_cache()
+        logger.debug("Reduced power for %s appliances", int(np.count_nonzero(reduced)))
         self.calculate_monthly_bill_for_7_days()
 
+    def _set_owner_status_text(self, text):
+        if self.gui.owner_status_label.text() != text:
+            self.gui.owner_status_label.setText(text)
+
     def update_owner_status(self):
+        if self.owner_home and not self._owner_status_dirty:
+            return
         current_time = QTime.currentTime()
         if self.owner_home:
-            self.gui.owner_status_label.setText("Owner is home")
+            self._set_owner_status_text("Owner is home")
             self.time_away = 0
             self.grace_countdown = 0
             self.return_time_passed = False
             for appliance in ["Air Conditioner", "Heater", "Water Heater", "Dehumidifier"]:
                 self.appliance_states[appliance] = True
+            self._owner_status_dirty = False
         else:
             if self.gui.enable_return_time_checkbox.isChecked() and self.saved_return_time:
                 if current_time < self.saved_return_time:
                     time_left = current_time.secsTo(self.saved_return_time) // 60
                     hours = time_left // 60
                     minutes = time_left % 60
-                    self.gui.owner_status_label.setText(f"Time left: {hours:02d}:{minutes:02d}")
+                    self._set_owner_status_text(f"Time left: {hours:02d}:{minutes:02d}")
                     self.return_time_passed = False
                     for appliance in ["Air Conditioner", "Heater", "Water Heater", "Dehumidifier"]:
                         turn_on_before = self.settings["turn_on_before"][appliance]
@@ -224,19 +300,19 @@ class EnergyCostPredictorApp:
                     if not self.return_time_passed:
                         self.return_time_passed = True
                         self.grace_countdown = self.settings["grace_period"]
-                        logging.debug(f"Return time passed. Starting grace period countdown: {self.grace_countdown} minutes")
+                        logger.debug("Return time passed. Starting grace period countdown: %s minutes", self.grace_countdown)
                     if self.grace_countdown > 0:
                         hours = self.grace_countdown // 60
                         minutes = self.grace_countdown % 60
-                        self.gui.owner_status_label.setText(f"Missed Return - Grace Period: {hours:02d}:{minutes:02d}")
+                        self._set_owner_status_text(f"Missed Return - Grace Period: {hours:02d}:{minutes:02d}")
                         self.grace_countdown -= 1
                     else:
-                        self.gui.owner_status_label.setText("Grace Period Ended - Power Reduced")
+                        self._set_owner_status_text("Grace Period Ended - Power Reduced")
                         self.reduce_appliance_power()
                         for appliance in ["Air Conditioner", "Heater", "Water Heater", "Dehumidifier"]:
                             self.appliance_states[appliance] = False
             else:
-                self.gui.owner_status_label.setText("Away")
+                self._set_owner_status_text("Away")
                 self.return_time_passed = False
                 self.grace_countdown = 0
                 turn_off_period = self.settings["turn_off_period"]
@@ -246,7 +322,7 @@ class EnergyCostPredictorApp:
                         if self.time_away >= turn_off_period + i * 5:
                             self.appliance_states[appliance] = False
             self.time_away += 1
-        logging.debug(f"Owner status updated: Home={self.owner_home}, States={self.appliance_states}")
+        logger.debug("Owner status updated: Home=%s, States=%s", self.owner_home, self.appliance_states)
 
     def open_settings_dialog(self):
         if not hasattr(self, 'original_appliances') or not self.original_appliances:
@@ -255,37 +331,35 @@ class EnergyCostPredictorApp:
         dialog = SettingsDialog(self.gui)
         if dialog.exec_():
             self.settings = dialog.get_settings()
-            logging.debug(f"Settings updated: {self.settings}")
+            logger.debug("Settings updated: %s", self.settings)
             self.update_weather_display()
 
     def check_for_model_update(self):
         try:
             seen_folders = self.load_seen_folders()
-            storage_client = storage.Client(credentials=AnonymousCredentials())
-            bucket = storage_client.bucket("big_data32")
-            blobs = bucket.list_blobs(delimiter="/")
-            current_folders = set(blob.name.split('/')[0] for blob in blobs if '/' in blob.name)
+            current_folders = self._list_model_folders()
             new_seen_folders = seen_folders.union(current_folders)
             self.save_seen_folders(new_seen_folders)
             new_folders = current_folders - seen_folders
             if not new_folders:
                 QMessageBox.information(self.gui, "No Update Found", "No new model folders found.")
                 return
-            for folder in sorted(new_folders):
-                model_url = f"https://storage.googleapis.com/big_data32/{folder}/gb_model.pkl"
-                try:
-                    urllib.request.urlopen(model_url).close()
-                except urllib.error.HTTPError as e:
+            candidates = sorted(new_folders)
+            model_urls = [f"{MODEL_BUCKET_URL}/{folder}/gb_model.pkl" for folder in candidates]
+            # Probe all new folders concurrently with HEAD requests rather than one
+            # body-downloading GET after another.
+            with ThreadPoolExecutor(max_workers=min(MODEL_CHECK_WORKERS, len(model_urls))) as executor:
+                available = list(executor.map(self._model_exists, model_urls))
+            for folder, model_url, exists in zip(candidates, model_urls, available):
+                if not exists:
                     continue
                 model_path = os.path.join(get_base_path(), "models", "gb_model.pkl")
-                old_model_path = model_path + ".old"
-                os.makedirs(os.path.dirname(model_path), exist_ok=True)
-                if os.path.exists(model_path):
-                    os.rename(model_path, old_model_path)
-                    os.remove(old_model_path)
-                urllib.request.urlretrieve(model_url, model_path)
-                self.model_loader.model = pickle.load(open(model_path, "rb"))
+                self._download_model(model_url, model_path)
+                with open(model_path, "rb") as f:
+                    self.model_loader.model = pickle.load(f)
                 self.bill_calculator = BillCalculator(self.model_loader.model)
+                self._invalidate_bill_cache()
+                self._folder_listing_cache = (0.0, None)
                 self.current_model_folder = folder
                 QMessageBox.information(
                     self.gui,
@@ -295,50 +369,221 @@ class EnergyCostPredictorApp:
             if new_folders and hasattr(self, 'original_appliances') and self.original_appliances:
                 self.calculate_monthly_bill_for_7_days()
         except Exception as e:
-            logging.error(f"Error checking for model update: {str(e)}")
+            logger.error("Error checking for model update: %s", e)
             QMessageBox.critical(self.gui, "Error", f"Failed to check for model update: {str(e)}")
 
+    def _list_model_folders(self):
+        """
+        List the top-level model folders in the bucket.
+
+        The listing is reused for MODEL_LISTING_TTL seconds so repeated checks in
+        quick succession do not hit the bucket again.
+
+        Returns:
+            set: Folder names present in the bucket.
+        """
+        fetched_at, folders = self._folder_listing_cache
+        if folders is not None and time.monotonic() - fetched_at < MODEL_LISTING_TTL:
+            logger.debug("Reusing model folder listing from %.0f s ago", time.monotonic() - fetched_at)
+            return set(folders)
+        storage_client = storage.Client(credentials=AnonymousCredentials())
+        bucket = storage_client.bucket("big_data32")
+        blobs = bucket.list_blobs(delimiter="/")
+        folders = frozenset(blob.name.split('/')[0] for blob in blobs if '/' in blob.name)
+        self._folder_listing_cache = (time.monotonic(), folders)
+        return set(folders)
+
+    def _get_http_session(self):
+        if self._http_session is None:
+            self._http_session = requests.Session()
+        return self._http_session
+
+    def _model_exists(self, model_url):
+        """
+        Check whether a model file exists in the bucket without downloading it.
+
+        Args:
+            model_url (str): Public URL of the model file.
+
+        Returns:
+            bool: True if the server answers the HEAD request with a success status.
+        """
+        response = self._get_http_session().head(model_url, timeout=MODEL_CHECK_TIMEOUT, allow_redirects=True)
+        return response.ok
+
+    def _download_model(self, model_url, model_path):
+        """
+        Stream a model file to disk and swap it in atomically.
+
+        The body is written to a temporary file next to the target while being
+        hashed; the current model is only replaced once the download completed,
+        so a failed download leaves it untouched.
+
+        Args:
+            model_url (str): Public URL of the model file.
+            model_path (str): Destination path of the model.
+
+        Returns:
+            str: SHA-256 hex digest of the downloaded file.
+        """
+        os.makedirs(os.path.dirname(model_path), exist_ok=True)
+        tmp_path = model_path + ".tmp"
+        digest = hashlib.sha256()
+        try:
+            with self._get_http_session().get(model_url, stream=True, timeout=MODEL_DOWNLOAD_TIMEOUT) as response:
+                response.raise_for_status()
+                with open(tmp_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=MODEL_DOWNLOAD_CHUNK_BYTES):
+                        f.write(chunk)
+                        digest.update(chunk)
+            os.replace(tmp_path, model_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        logger.info("Downloaded %s (sha256 %s)", model_url, digest.hexdigest())
+        return digest.hexdigest()
+
+    def _invalidate_bill_cache(self):
+        self._dataset_token += 1
+        self._bill_cache.clear()
+
+    def _build_usage_index(self, original_appliances):
+        """
+        Build the arrays profile recomputation works from.
+
+        Holds the appliances as per-field columns, the sorted distinct dates,
+        each appliance's column in the profile factor matrix, the original
+        usage durations and a usage rescaler over the scaled features, so
+        profile factors can be applied with one gather, one vectorized multiply
+        and one column rescale. Reads only its argument, the loaded
+        encoders/scaler and the fixed profile factor table, so it is safe to run
+        off the GUI thread.
+
+        Once applied, _original_usage is the source of truth for the bill:
+        reduce_appliance_power scales it in place and leaves the appliance
+        dictionaries as they were loaded.
+
+        Args:
+            original_appliances (list): Appliance dictionaries to index.
+
+        Returns:
+            dict: Attribute name to value, applied with _apply_usage_index().
+        """
+        columns = appliances_to_columns(original_appliances)
+        device_types, device_idx = np.unique(columns["Device Type"], return_inverse=True)
+        # Column of each appliance in the profile factor matrix; device types
+        # without a column map to the trailing default column.
+        default_column = len(self._factor_column)
+        column_of_type = np.array(
+            [self._factor_column.get(device_type, default_column) for device_type in device_types],
+            dtype=np.intp
+        )
+
+        # Every feature except usage is fixed for a dataset, so preprocessing is
+        # specialized once and only the usage column is rescaled per profile.
+        rescale, valid_indices = make_usage_rescaler(
+            original_appliances,
+            self.model_loader.device_encoder,
+            self.model_loader.room_encoder,
+            self.model_loader.scaler
+        )
+        return {
+            "_columns": columns,
+            "_factor_column_idx": column_of_type[device_idx],
+            "_unique_dates": np.unique(columns["Date"]).tolist(),
+            "_original_usage": columns["Usage Duration (minutes)"],
+            "_rescale": rescale,
+            "_valid_date_set": frozenset(columns["Date"][np.asarray(valid_indices, dtype=np.intp)].tolist()),
+            "_daily_costs_buf": np.empty(len(valid_indices), dtype=np.float64),
+        }
+
+    def _apply_usage_index(self, usage_index):
+        self._invalidate_bill_cache()
+        for name, value in usage_index.items():
+            setattr(self, name, value)
+
+    def _build_profile_factor_matrix(self):
+        """
+        Tabulate every profile's usage factor per device type.
+
+        Rows follow self.energy_profiles. Columns are the device encoder's
+        classes, then any other device type a profile names, then one trailing
+        column holding each profile's default factor for all remaining types.
+
+        Returns:
+            tuple: (profile_index, factor_column, factor_matrix)
+                - profile_index (dict): Profile name to row index.
+                - factor_column (dict): Device type to column index.
+                - factor_matrix (numpy.ndarray): (profiles, columns + 1) float64 factors.
+        """
+        device_types = list(self.model_loader.device_encoder.classes_)
+        named_types = set()
+        for profile in self.energy_profiles.values():
+            named_types.update(profile["usage_factors"])
+        named_types.discard("default")
+        device_types += sorted(named_types.difference(device_types))
+        factor_column = {device_type: i for i, device_type in enumerate(device_types)}
+
+        profile_index = {}
+        rows = []
+        for row, (profile_name, profile) in enumerate(self.energy_profiles.items()):
+            usage_factors = profile["usage_factors"]
+            default_factor = usage_factors["default"]
+            profile_index[profile_name] = row
+            rows.append([usage_factors.get(device_type, default_factor) for device_type in device_types] + [default_factor])
+        return profile_index, factor_column, np.array(rows, dtype=np.float64)
+
+    def _adjusted_usage(self, profile_name):
+        """
+        Usage durations of original_appliances scaled by a profile's factors.
+
+        Args:
+            profile_name (str): Key into self.energy_profiles.
+
+        Returns:
+            numpy.ndarray: Adjusted usage in minutes, aligned with original_appliances.
+        """
+        factors = self._profile_factor_matrix[self._profile_index[profile_name]]
+        return self._original_usage * factors[self._factor_column_idx]
+
     def calculate_monthly_bill_for_7_days(self):
         try:
             if not hasattr(self, 'original_appliances') or not self.original_appliances:
                 self.gui.update_monthly_bill(0.0)
                 return
-            dates = sorted(list(set(item["Date"] for item in self.original_appliances)))
+            dates = self._unique_dates
             if len(dates) != 7:
                 self.gui.update_monthly_bill(0.0)
                 return
-            profile = self.energy_profiles[self.current_profile]
-            usage_factors = profile["usage_factors"]
-            total_daily_costs = 0.0
+            cache_key = (self.current_profile, self._dataset_token)
+            cached_bill = self._bill_cache.get(cache_key)
+            if cached_bill is not None:
+                self.gui.update_monthly_bill(cached_bill)
+                return
+            scaled_features = self._rescale(self._adjusted_usage(self.current_profile))
+            if scaled_features is None:
+                self.gui.update_monthly_bill(0.0)
+                return
             num_days = len(dates)
-            for date in dates:
-                daily_data = [item for item in self.original_appliances if item["Date"] == date]
-                adjusted_appliances = copy.deepcopy(daily_data)
-                for idx, appliance in enumerate(adjusted_appliances):
-                    device_type = appliance["Device Type"]
-                    factor = usage_factors.get(device_type, usage_factors["default"])
-                    original_usage = appliance["Usage Duration (minutes)"]
-                    appliance["Usage Duration (minutes)"] = original_usage * factor
-                scaled_features, valid_indices = preprocess_appliances(
-                    adjusted_appliances,
-                    self.model_loader.device_encoder,
-                    self.model_loader.room_encoder,
-                    self.model_loader.scaler
-                )
-                if scaled_features is not None:
-                    daily_costs = self.bill_calculator.calculate_daily_costs(scaled_features)
-                    total_daily_costs += sum(daily_costs)
-                else:
-                    self.gui.update_monthly_bill(0.0)
-                    return
+            if not self._valid_date_set.issuperset(dates):
+                self.gui.update_monthly_bill(0.0)
+                return
+            # Only the week's total is needed, so all days are predicted in one call.
+            daily_costs = self.bill_calculator.calculate_daily_costs(scaled_features, out=self._daily_costs_buf)
+            total_daily_costs = float(daily_costs.sum())
             average_daily_cost = total_daily_costs / num_days
             total_monthly_bill = average_daily_cost 
+            self._bill_cache[cache_key] = total_monthly_bill
             self.gui.update_monthly_bill(total_monthly_bill)
         except Exception as e:
-            logging.error(f"Error calculating monthly bill for 7 days: {str(e)}")
+            logger.error("Error calculating monthly bill for 7 days: %s", e)
             self.gui.update_monthly_bill(0.0)
 
     def load_dataset(self):
+        if self._load_worker is not None:
+            logger.info("Dataset load already in progress")
+            return
         try:
             file_path, _ = QFileDialog.getOpenFileName(
                 self.gui,
@@ -349,20 +594,62 @@ class EnergyCostPredictorApp:
             if not file_path:
                 QMessageBox.warning(self.gui, "Warning", "No file selected.")
                 return
-            if not self.data_manager.load_data_from_file(file_path):
+            self._load_worker = _DatasetLoadWorker(self._read_dataset, file_path)
+            self._load_worker.signals.loaded.connect(self._on_dataset_loaded)
+            self._load_worker.signals.failed.connect(self._on_dataset_load_failed)
+            QThreadPool.globalInstance().start(self._load_worker)
+        except Exception as e:
+            logger.error("Error in load_dataset: %s", e)
+            QMessageBox.critical(self.gui, "Error", f"Failed to load dataset: {str(e)}")
+
+    def _read_dataset(self, file_path):
+        """
+        Read a dataset and build its usage index. Runs on a worker thread.
+
+        Args:
+            file_path (str): Path to the JSON dataset.
+
+        Returns:
+            tuple or None: (appliances, usage_index), or None if the file could
+            not be loaded.
+        """
+        if not self.data_manager.load_data_from_file(file_path):
+            return None
+        appliances = self.data_manager.get_appliances()
+        return appliances, self._build_usage_index(appliances)
+
+    def _on_dataset_loaded(self, result):
+        self._load_worker = None
+        try:
+            if result is None:
                 QMessageBox.warning(self.gui, "Error", "Failed to load dataset. Please select a valid JSON file.")
                 return
-            self.appliances = self.data_manager.get_appliances()
-            self.original_appliances = copy.deepcopy(self.appliances)
+            self.appliances, usage_index = result
+            # The records are never modified; the bill works from the usage index.
+            self.original_appliances = self.appliances
+            self._apply_usage_index(usage_index)
             self.gui.set_weekly_data(self.appliances)
             if self.appliances:
                 self.calculate_monthly_bill_for_7_days()
             else:
                 QMessageBox.warning(self.gui, "Error", "Empty dataset loaded.")
         except Exception as e:
-            logging.error(f"Error in load_dataset: {str(e)}")
+            logger.error("Error in load_dataset: %s", e)
             QMessageBox.critical(self.gui, "Error", f"Failed to load dataset: {str(e)}")
 
+    def _on_dataset_load_failed(self, message):
+        self._load_worker = None
+        QMessageBox.critical(self.gui, "Error", f"Failed to load dataset: {message}")
+
+    def _queue_profile_change(self, profile_name):
+        self._pending_profile = profile_name
+        self._profile_timer.start()
+
+    def _apply_pending_profile(self):
+        profile_name, self._pending_profile = self._pending_profile, None
+        if profile_name is not None:
+            self.change_profile(profile_name)
+
     def change_profile(self, profile_name):
         try:
             if profile_name not in self.energy_profiles:
@@ -382,7 +669,7 @@ class EnergyCostPredictorApp:
             if hasattr(self, 'original_appliances') and self.original_appliances:
                 self.calculate_monthly_bill_for_7_days()
         except Exception as e:
-            logging.error(f"Error in change_profile: {str(e)}")
+            logger.error("Error in change_profile: %s", e)
             QMessageBox.critical(self.gui, "Error", f"Failed to change profile: {str(e)}")
 
     def update_bill_for_day(self, daily_data):
@@ -396,12 +683,13 @@ class EnergyCostPredictorApp:
             else:
                 self.gui.update_weather(None, None, None, self.settings)
         except Exception as e:
-            logging.error(f"Error updating weather display: {str(e)}")
+            logger.error("Error updating weather display: %s", e)
             self.gui.update_weather(None, None, None, self.settings)
 
     def run(self):
         sys.exit(self.app.exec_())
 
 if __name__ == "__main__":
+    configure_logging()
     app = EnergyCostPredictorApp()
     app.run()
\ No newline at end of file
@@ -3,7 +3,7 @@ import os
 import sys
 import logging
 
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 # Function to get the base path of the executable or script
 def get_base_path():
@@ -30,31 +30,31 @@ class ModelLoader:
         try:
             # Load model
             model_path = os.path.join(self.base_path, "gb_model.pkl")
-            logging.debug(f"Loading model from: {model_path}")
+            logger.debug("Loading model from: %s", model_path)
             self.model = joblib.load(model_path)
 
             # Load device encoder
             device_encoder_path = os.path.join(self.base_path, "device_encoder.pkl")
-            logging.debug(f"Loading device encoder from: {device_encoder_path}")
+            logger.debug("Loading device encoder from: %s", device_encoder_path)
             self.device_encoder = joblib.load(device_encoder_path)
 
             # Load room encoder
             room_encoder_path = os.path.join(self.base_path, "room_encoder.pkl")
-            logging.debug(f"Loading room encoder from: {room_encoder_path}")
+            logger.debug("Loading room encoder from: %s", room_encoder_path)
             self.room_encoder = joblib.load(room_encoder_path)
 
             # Load scaler
             scaler_path = os.path.join(self.base_path, "scaler.pkl")
-            logging.debug(f"Loading scaler from: {scaler_path}")
+            logger.debug("Loading scaler from: %s", scaler_path)
             self.scaler = joblib.load(scaler_path)
 
-            logging.debug("All assets loaded successfully")
+            logger.debug("All assets loaded successfully")
             return True, "Assets loaded successfully"
         except FileNotFoundError as e:
             error_msg = f"File not found: {str(e)}. Please ensure all .pkl files are in '{self.base_path}'."
-            logging.error(error_msg)
+            logger.error(error_msg)
             return False, error_msg
         except Exception as e:
             error_msg = f"Failed to load assets: {str(e)}"
-            logging.error(error_msg)
+            logger.error(error_msg)
             return False, error_msg
\ No newline at end of file
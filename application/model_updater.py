@@ -1,4 +1,5 @@
 import os
+import time
 import joblib
 import pandas as pd
 from google.cloud import storage
@@ -12,12 +13,25 @@ MODEL_BASE_PATH = "models/"
 LOCAL_MODEL_DIR = "./models/"
 VERSION_FILE = "./model_version.txt"
 FILE_NAMES = ["gb_model.pkl", "device_encoder.pkl", "room_encoder.pkl", "scaler.pkl"]
+VERSION_LISTING_TTL = 60  # seconds a bucket listing is reused for
+
+# bucket name -> (monotonic timestamp, latest version)
+_version_cache = {}
 
 # Ensure local model directory exists
 os.makedirs(LOCAL_MODEL_DIR, exist_ok=True)
 
 def get_latest_model_version(bucket):
     """Get the latest model version folder from GCS based on timestamp."""
+    cached = _version_cache.get(bucket.name)
+    if cached is not None and time.monotonic() - cached[0] < VERSION_LISTING_TTL:
+        return cached[1]
+    latest_version = _list_latest_model_version(bucket)
+    _version_cache[bucket.name] = (time.monotonic(), latest_version)
+    return latest_version
+
+def _list_latest_model_version(bucket):
+    """List the bucket and return the newest version folder, or None."""
     blobs = bucket.list_blobs(prefix=MODEL_BASE_PATH)
     version_folders = set()
     for blob in blobs:
@@ -92,6 +106,8 @@ def check_and_update_model():
         download_model_files(bucket, latest_version, LOCAL_MODEL_DIR)
         # Update local version
         save_local_version(latest_version)
+        # Make the next check list the bucket again
+        _version_cache.pop(bucket.name, None)
         # Load new model and preprocessors
         model, device_encoder, room_encoder, scaler = load_model_and_preprocessors(LOCAL_MODEL_DIR)
         if model is not None:
@@ -1,9 +1,22 @@
+import numpy as np
 import pandas as pd
 import logging
 
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
-def preprocess_appliances(appliances, device_encoder, room_encoder, scaler):
+# Feature columns expected by the model, in order
+FEATURE_COLUMNS = [
+    "Device Type",
+    "Power Consumption (W)",
+    "Room Location",
+    "Temperature (°C)",
+    "Humidity (%)",
+    "Usage Duration (minutes)",
+    "On/Off Status"
+]
+USAGE_FEATURE_INDEX = FEATURE_COLUMNS.index("Usage Duration (minutes)")
+
+def preprocess_appliances(appliances, device_encoder, room_encoder, scaler, usage_override=None):
     """
     Preprocess a list of appliances for prediction.
 
@@ -12,28 +25,19 @@ def preprocess_appliances(appliances, device_encoder, room_encoder, scaler):
         device_encoder (LabelEncoder): Encoder for device types.
         room_encoder (LabelEncoder): Encoder for room locations.
         scaler (StandardScaler): Scaler for feature scaling.
+        usage_override (array-like, optional): Usage durations in minutes, one per
+            appliance, used instead of each appliance's "Usage Duration (minutes)".
 
     Returns:
         tuple: (scaled_features, valid_indices)
             - scaled_features: Preprocessed and scaled features for valid appliances.
             - valid_indices: Indices of appliances that were successfully preprocessed.
     """
-    logging.debug(f"Preprocessing {len(appliances)} appliances")
+    logger.debug("Preprocessing %s appliances", len(appliances))
 
     data = []
     valid_indices = []
 
-    # Define the feature columns expected by the model
-    feature_columns = [
-        "Device Type",
-        "Power Consumption (W)",
-        "Room Location",
-        "Temperature (°C)",
-        "Humidity (%)",
-        "Usage Duration (minutes)",
-        "On/Off Status"
-    ]
-
     # Process each appliance
     for idx, appliance in enumerate(appliances):
         try:
@@ -44,8 +48,11 @@ def preprocess_appliances(appliances, device_encoder, room_encoder, scaler):
             # Convert on/off status to binary (1 for On, 0 for Off)
             status_binary = 1 if appliance["On/Off Status"].lower() == 'on' else 0
 
-            # Use the recorded usage duration regardless of On/Off Status
-            usage_duration = float(appliance["Usage Duration (minutes)"])
+            # Use the recorded (or overridden) usage duration regardless of On/Off Status
+            if usage_override is None:
+                usage_duration = float(appliance["Usage Duration (minutes)"])
+            else:
+                usage_duration = float(usage_override[idx])
 
             # Create a row of features
             row = [
@@ -61,16 +68,81 @@ def preprocess_appliances(appliances, device_encoder, room_encoder, scaler):
             data.append(row)
             valid_indices.append(idx)
         except Exception as e:
-            logging.error(f"Failed to preprocess appliance {idx}: {str(e)}")
+            logger.error("Failed to preprocess appliance %s: %s", idx, e)
             continue
 
     if not data:
-        logging.warning("No valid appliances to preprocess")
+        logger.warning("No valid appliances to preprocess")
         return None, []
 
     # Convert to DataFrame
-    features_df = pd.DataFrame(data, columns=feature_columns)
+    features_df = pd.DataFrame(data, columns=FEATURE_COLUMNS)
     # Scale the features
     scaled_features = scaler.transform(features_df)
-    logging.debug(f"Preprocessed {len(data)} appliances successfully")
-    return scaled_features, valid_indices
\ No newline at end of file
+    logger.debug("Preprocessed %s appliances successfully", len(data))
+    return scaled_features, valid_indices
+
+def make_usage_rescaler(appliances, device_encoder, room_encoder, scaler):
+    """
+    Specialize preprocessing for a dataset in which only the usage column changes.
+
+    The appliances are preprocessed once; the returned function then only
+    rescales the usage column from the scaler's mean_/scale_ (as enabled by
+    with_mean/with_std), falling back to a full preprocess_appliances call when
+    the scaler does not expose them.
+
+    Args:
+        appliances (list): List of dictionaries containing appliance data.
+        device_encoder (LabelEncoder): Encoder for device types.
+        room_encoder (LabelEncoder): Encoder for room locations.
+        scaler (StandardScaler): Scaler for feature scaling.
+
+    Returns:
+        tuple: (rescale, valid_indices)
+            - rescale: Function taking usage durations aligned with `appliances`
+              and returning the scaled features of the valid appliances, or None
+              if no appliance could be preprocessed. The returned array may be
+              reused by the next call, so copy it to keep it.
+            - valid_indices: Indices of appliances that were successfully preprocessed.
+    """
+    static_features, valid_indices = preprocess_appliances(appliances, device_encoder, room_encoder, scaler)
+    if static_features is None:
+        return (lambda usage: None), valid_indices
+
+    # StandardScaler only applies mean_/scale_ when with_mean/with_std are set
+    # (mean_ is fitted either way), so the usage column's affine transform
+    # follows those flags; anything it cannot be read from uses transform().
+    usage_mean = usage_scale = None
+    if getattr(scaler, "with_mean", True):
+        mean = getattr(scaler, "mean_", None)
+        if mean is not None:
+            usage_mean = mean[USAGE_FEATURE_INDEX]
+    else:
+        usage_mean = 0.0
+    if getattr(scaler, "with_std", True):
+        scale = getattr(scaler, "scale_", None)
+        if scale is not None:
+            usage_scale = scale[USAGE_FEATURE_INDEX]
+    else:
+        usage_scale = 1.0
+    if usage_mean is None or usage_scale is None:
+        def rescale(usage):
+            scaled_features, _ = preprocess_appliances(
+                appliances, device_encoder, room_encoder, scaler, usage_override=usage
+            )
+            return scaled_features
+        return rescale, valid_indices
+
+    rows = np.asarray(valid_indices, dtype=np.intp)
+    # The static columns never change, so one feature buffer is reused and only
+    # its usage column is rewritten in place on each call.
+    features = static_features.copy()
+    usage_column = np.empty(len(rows), dtype=np.float64)
+
+    def rescale(usage):
+        np.take(np.asarray(usage, dtype=np.float64), rows, out=usage_column)
+        np.subtract(usage_column, usage_mean, out=usage_column)
+        np.divide(usage_column, usage_scale, out=usage_column)
+        features[:, USAGE_FEATURE_INDEX] = usage_column
+        return features
+    return rescale, valid_indices
@@ -0,0 +1,74 @@
+import os
+import sys
+
+import pytest
+
+# GUI tests run without a display.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+APPLICATION_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "application")
+if APPLICATION_DIR not in sys.path:
+    sys.path.insert(0, APPLICATION_DIR)
+
+DEVICE_TYPES = ["Air Conditioner", "Heater", "Refrigerator", "TV"]
+ROOM_LOCATIONS = ["Bedroom", "Kitchen", "Living Room"]
+DATES = ["2025-06-0%d" % day for day in range(1, 8)]
+
+
+def _make_appliances(count=28):
+    """Deterministic appliance records spread over DATES, DEVICE_TYPES and ROOM_LOCATIONS."""
+    appliances = []
+    for i in range(count):
+        appliances.append({
+            "Date": DATES[i % len(DATES)],
+            "Device Type": DEVICE_TYPES[i % len(DEVICE_TYPES)],
+            "Room Location": ROOM_LOCATIONS[i % len(ROOM_LOCATIONS)],
+            "Power Consumption (W)": 100.0 + 37.0 * i,
+            "Temperature (°C)": 18.0 + (i % 9),
+            "Humidity (%)": 35.0 + (i % 13),
+            "Usage Duration (minutes)": 15.0 + 11.0 * (i % 10),
+            "On/Off Status": "On" if i % 3 else "Off",
+            "Turn On Time": "%02d:00" % (i % 24),
+        })
+    return appliances
+
+
+@pytest.fixture
+def appliances():
+    return _make_appliances()
+
+
+@pytest.fixture
+def make_appliances():
+    """Factory for deterministic appliance records: make_appliances(count=28)."""
+    return _make_appliances
+
+
+@pytest.fixture
+def encoders():
+    from sklearn.preprocessing import LabelEncoder
+    return LabelEncoder().fit(DEVICE_TYPES), LabelEncoder().fit(ROOM_LOCATIONS)
+
+
+def _fit_scaler(appliances, device_encoder, room_encoder, **scaler_kwargs):
+    """Fit a StandardScaler on the raw feature rows of `appliances`."""
+    import pandas as pd
+    from sklearn.preprocessing import StandardScaler
+    from preprocessor import FEATURE_COLUMNS
+
+    rows = [[
+        device_encoder.transform([a["Device Type"]])[0],
+        a["Power Consumption (W)"],
+        room_encoder.transform([a["Room Location"]])[0],
+        a["Temperature (°C)"],
+        a["Humidity (%)"],
+        a["Usage Duration (minutes)"],
+        1 if a["On/Off Status"].lower() == "on" else 0,
+    ] for a in appliances]
+    return StandardScaler(**scaler_kwargs).fit(pd.DataFrame(rows, columns=FEATURE_COLUMNS))
+
+
+@pytest.fixture
+def fit_scaler():
+    """Factory fitting a StandardScaler: fit_scaler(appliances, device_encoder, room_encoder, **kwargs)."""
+    return _fit_scaler
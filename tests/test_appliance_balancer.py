@@ -0,0 +1,30 @@
+import copy
+
+import numpy as np
+
+from appliance_balancer import ApplianceBalancer
+from bill_calculator import BillCalculator
+
+
+def _appliance(device_type, usage):
+    return {"Device Type": device_type, "Usage Duration (minutes)": usage}
+
+
+def test_balance_appliances_leaves_caller_dicts_unchanged():
+    appliances = [
+        _appliance("Heater", 240.0),
+        _appliance("TV", 180.0),
+        _appliance("Laptop Charger", 120.0),
+        _appliance("Refrigerator", 1440.0),
+    ]
+    before = copy.deepcopy(appliances)
+    daily_costs = np.array([100.0, 80.0, 50.0, 1.0])
+    balancer = ApplianceBalancer(BillCalculator(model=None))
+
+    adjusted, adjustments = balancer.balance_appliances(appliances, daily_costs, 200.0, [0, 1, 2, 3])
+
+    assert adjustments
+    assert appliances == before
+    assert all(a is not b for a, b in zip(adjusted, appliances))
+    assert adjusted[0]["Usage Duration (minutes)"] < before[0]["Usage Duration (minutes)"]
+    assert adjusted[3] == before[3]
@@ -0,0 +1,25 @@
+from datetime import datetime
+
+import pytest
+
+from appliance_controller import _parse_hhmm
+
+
+def _strptime_hhmm(value):
+    parsed = datetime.strptime(value, '%H:%M')
+    return parsed.hour, parsed.minute
+
+
+@pytest.mark.parametrize("value", [
+    "00:00", "07:30", "23:59", "9:05", "07:5", "24:00", "12:60",
+    "07:30\n", "\n07:30", " 07:30", "07:30 ", "0730", "07-30", "",
+    "٠٧:٣٠",  # Arabic-Indic digits
+])
+def test_parse_hhmm_accepts_exactly_what_strptime_accepts(value):
+    try:
+        expected = _strptime_hhmm(value)
+    except ValueError:
+        with pytest.raises(ValueError):
+            _parse_hhmm(value)
+    else:
+        assert _parse_hhmm(value) == expected
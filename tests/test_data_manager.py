@@ -0,0 +1,73 @@
+import json
+import os
+
+import pytest
+
+import data_manager
+from data_manager import DataManager
+
+
+@pytest.fixture
+def loaded(tmp_path, appliances):
+    path = tmp_path / "appliances.json"
+    # Formatted like the shipped datasets, which differs from what _dumps writes.
+    path.write_text(json.dumps(appliances, indent=4, ensure_ascii=False), encoding="utf-8")
+    manager = DataManager()
+    assert manager.load_data_from_file(str(path))
+    return manager, path
+
+
+def test_update_appliances_writes_and_reloads(loaded, appliances):
+    manager, path = loaded
+    appliances[0]["Usage Duration (minutes)"] = 999.0
+
+    manager.update_appliances(appliances)
+
+    assert json.loads(path.read_text(encoding="utf-8")) == appliances
+    assert not os.path.exists(str(path) + ".tmp")
+
+
+def test_unchanged_data_is_not_rewritten(loaded, monkeypatch):
+    manager, path = loaded
+    original = path.read_bytes()
+    replaced = []
+    monkeypatch.setattr(data_manager.os, "replace", lambda src, dst: replaced.append(dst))
+
+    manager.update_appliances(manager.get_appliances())
+
+    assert replaced == []
+    assert path.read_bytes() == original
+
+
+def test_failed_write_keeps_original_file(loaded, monkeypatch):
+    manager, path = loaded
+    original = path.read_bytes()
+
+    def broken_replace(src, dst):
+        raise OSError("disk full")
+    monkeypatch.setattr(data_manager.os, "replace", broken_replace)
+
+    assert not manager.delete_appliance_at_index(0)
+    assert path.read_bytes() == original
+    assert not os.path.exists(str(path) + ".tmp")
+
+
+def test_delete_appliance_at_index_persists(loaded, appliances):
+    manager, path = loaded
+
+    assert manager.delete_appliance_at_index(0)
+
+    assert json.loads(path.read_text(encoding="utf-8")) == appliances[1:]
+
+
+def test_streamed_load_matches_in_memory_load(loaded, monkeypatch):
+    pytest.importorskip("ijson")
+    manager, path = loaded
+    monkeypatch.setattr(data_manager, "STREAM_PARSE_THRESHOLD_BYTES", 0)
+    streamed = DataManager()
+
+    assert streamed.load_data_from_file(str(path))
+
+    assert streamed.get_appliances() == manager.get_appliances()
+    assert all(type(a[key]) is type(b[key])
+               for a, b in zip(streamed.get_appliances(), manager.get_appliances()) for key in a)
@@ -0,0 +1,134 @@
+import random
+
+import numpy as np
+import pytest
+
+from gui_components import _aggregate_usage, weekly_data_from_records
+
+DEVICE_TYPES = ["Heater", "TV", "Microwave"]
+DATES = ["2025-06-0%d" % day for day in range(1, 9)]
+
+
+def _baseline_usage(records, dates, appliance):
+    # The per-date scan UsageGraphDialog.update_graph did before _aggregate_usage.
+    usage_data = [0.0] * len(dates)
+    for i, date in enumerate(dates):
+        daily_data = [item for item in records if item["Date"] == date]
+        for item in daily_data:
+            if item["Device Type"] == appliance and item["On/Off Status"] == "On":
+                if item["Turn On Time"] != "N/A":
+                    usage_data[i] = item["Usage Duration (minutes)"]
+                break
+    return usage_data
+
+
+def _random_records(rng, count):
+    return [{
+        "Device Type": rng.choice(DEVICE_TYPES),
+        # The last date is never plotted, so some records fall outside the graph.
+        "Date": rng.choice(DATES),
+        "On/Off Status": rng.choice(["On", "On", "Off"]),
+        "Turn On Time": rng.choice(["N/A", "07:00", "18:30"]),
+        "Usage Duration (minutes)": float(rng.randrange(0, 600)),
+    } for _ in range(count)]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_aggregate_usage_matches_baseline_scan(seed):
+    rng = random.Random(seed)
+    records = _random_records(rng, rng.randrange(0, 60))
+    dates = DATES[:7]
+    weekly_data = weekly_data_from_records(records)
+
+    appliances, device_idx = np.unique(weekly_data.device_type, return_inverse=True)
+    date_pos = {date: i for i, date in enumerate(dates)}
+    date_idx = np.array([date_pos.get(date, -1) for date in weekly_data.date], dtype=np.int32)
+
+    for appliance_index, appliance in enumerate(appliances.tolist()):
+        usage = _aggregate_usage(
+            device_idx, date_idx, weekly_data.is_on, weekly_data.has_turn_on,
+            weekly_data.duration, appliance_index, len(dates)
+        )
+        np.testing.assert_array_equal(usage, np.float32(_baseline_usage(records, dates, appliance)))
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    from PyQt5.QtWidgets import QApplication
+    return QApplication.instance() or QApplication([])
+
+
+def _table_rows(count, usage=60.0):
+    return [{
+        "Device Type": DEVICE_TYPES[i % len(DEVICE_TYPES)],
+        "Power Consumption (W)": 100.0 + i,
+        "Room Location": "Kitchen",
+        "Temperature (°C)": 21.5,
+        "Humidity (%)": 40.0,
+        "Usage Duration (minutes)": usage,
+        "On/Off Status": "On",
+        "Turn On Time": "07:00",
+    } for i in range(count)]
+
+
+def _cell_texts(model):
+    return [[model.data(model.index(row, column)) for column in range(model.columnCount())]
+            for row in range(model.rowCount())]
+
+
+def _record_signals(model):
+    events = []
+    model.modelReset.connect(lambda: events.append(("reset",)))
+    model.dataChanged.connect(lambda top, bottom, roles: events.append(("changed", top.row(), bottom.row())))
+    return events
+
+
+def test_set_rows_formats_cells(qapp):
+    from gui_components import ApplianceTableModel
+    model = ApplianceTableModel()
+    model.set_rows(_table_rows(2), adjusted_indices=[1])
+
+    assert _cell_texts(model) == [
+        ["Heater", "100.00", "Kitchen", "21.50", "40.00", "60.00", "On", "07:00", "No"],
+        ["TV", "101.00", "Kitchen", "21.50", "40.00", "60.00", "On", "07:00", "Yes"],
+    ]
+
+
+def test_set_rows_same_row_count_emits_changed_span_only(qapp):
+    from gui_components import ApplianceTableModel
+    model = ApplianceTableModel()
+    model.set_rows(_table_rows(6))
+    events = _record_signals(model)
+
+    rows = _table_rows(6)
+    rows[2]["Usage Duration (minutes)"] = 30.0
+    rows[4]["On/Off Status"] = "Off"
+    model.set_rows(rows)
+
+    assert events == [("changed", 2, 4)]
+    fresh = ApplianceTableModel()
+    fresh.set_rows(rows)
+    assert _cell_texts(model) == _cell_texts(fresh)
+
+
+def test_set_rows_unchanged_rows_emit_nothing(qapp):
+    from gui_components import ApplianceTableModel
+    model = ApplianceTableModel()
+    model.set_rows(_table_rows(3), adjusted_indices=[0])
+    events = _record_signals(model)
+
+    model.set_rows(_table_rows(3), adjusted_indices=[0])
+
+    assert events == []
+
+
+def test_set_rows_new_row_count_resets(qapp):
+    from gui_components import ApplianceTableModel
+    model = ApplianceTableModel()
+    model.set_rows(_table_rows(3))
+    events = _record_signals(model)
+
+    model.set_rows(_table_rows(5))
+
+    assert events == [("reset",)]
+    assert model.rowCount() == 5
@@ -0,0 +1,144 @@
+import copy
+import json
+
+import pytest
+
+from PyQt5.QtWidgets import QApplication
+from sklearn.linear_model import LinearRegression
+
+import main
+from preprocessor import preprocess_appliances
+
+
+class _CountingModel:
+    """Wraps a fitted regressor and counts predict calls."""
+    def __init__(self, model):
+        self.model = model
+        self.predict_calls = 0
+
+    def predict(self, features):
+        self.predict_calls += 1
+        return self.model.predict(features)
+
+
+def _fit_model(appliances, device_encoder, room_encoder, scaler):
+    features, _ = preprocess_appliances(appliances, device_encoder, room_encoder, scaler)
+    targets = [a["Power Consumption (W)"] * a["Usage Duration (minutes)"] / 6000.0 for a in appliances]
+    return LinearRegression().fit(features, targets)
+
+
+@pytest.fixture
+def app(monkeypatch, tmp_path, encoders, make_appliances, fit_scaler):
+    device_encoder, room_encoder = encoders
+    training = make_appliances(56)
+    scaler = fit_scaler(training, device_encoder, room_encoder)
+    model = _CountingModel(_fit_model(training, device_encoder, room_encoder, scaler))
+
+    class FakeModelLoader:
+        def __init__(self):
+            self.model = model
+            self.device_encoder = device_encoder
+            self.room_encoder = room_encoder
+            self.scaler = scaler
+
+        def load_assets(self):
+            return True, "Assets loaded successfully"
+
+    monkeypatch.setattr(main, "ModelLoader", FakeModelLoader)
+    monkeypatch.setattr(main, "QApplication", lambda argv: QApplication.instance() or QApplication(argv))
+    monkeypatch.setattr(main, "get_base_path", lambda: str(tmp_path))
+    energy_app = main.EnergyCostPredictorApp()
+    energy_app.bills = []
+    monkeypatch.setattr(energy_app.gui, "update_monthly_bill", energy_app.bills.append)
+    yield energy_app
+    energy_app.gui.close()
+
+
+def _load(app, tmp_path, appliances):
+    path = tmp_path / "dataset.json"
+    path.write_text(json.dumps(appliances))
+    app._on_dataset_loaded(app._read_dataset(str(path)))
+
+
+def _baseline_bill(app, appliances, profile_name):
+    # calculate_monthly_bill_for_7_days as it was before the usage index:
+    # one preprocess and predict per date over deep-copied, profile-adjusted records.
+    dates = sorted(set(item["Date"] for item in appliances))
+    if len(dates) != 7:
+        return 0.0
+    usage_factors = app.energy_profiles[profile_name]["usage_factors"]
+    total_daily_costs = 0.0
+    for date in dates:
+        adjusted_appliances = copy.deepcopy([item for item in appliances if item["Date"] == date])
+        for appliance in adjusted_appliances:
+            factor = usage_factors.get(appliance["Device Type"], usage_factors["default"])
+            appliance["Usage Duration (minutes)"] = appliance["Usage Duration (minutes)"] * factor
+        scaled_features, _ = preprocess_appliances(
+            adjusted_appliances,
+            app.model_loader.device_encoder,
+            app.model_loader.room_encoder,
+            app.model_loader.scaler
+        )
+        if scaled_features is None:
+            return 0.0
+        total_daily_costs += sum(app.model_loader.model.model.predict(scaled_features))
+    return total_daily_costs / len(dates)
+
+
+@pytest.mark.parametrize("profile_name", ["Eco", "Balanced", "Comfort", "Normal"])
+def test_weekly_bill_matches_baseline(app, tmp_path, appliances, profile_name):
+    _load(app, tmp_path, appliances)
+    app.change_profile(profile_name)
+
+    assert app.bills[-1] == pytest.approx(_baseline_bill(app, appliances, profile_name))
+
+
+def test_weekly_bill_is_cached_per_profile(app, tmp_path, appliances):
+    _load(app, tmp_path, appliances)
+    model = app.model_loader.model
+    normal_bill = app.bills[-1]
+    calls = model.predict_calls
+
+    app.calculate_monthly_bill_for_7_days()
+    assert model.predict_calls == calls
+    assert app.bills[-1] == normal_bill
+
+    app.change_profile("Eco")
+    assert model.predict_calls == calls + 1
+    app.change_profile("Normal")
+    assert model.predict_calls == calls + 1
+    assert app.bills[-1] == normal_bill
+
+
+def test_week_with_an_unprocessable_day_bills_zero(app, tmp_path, appliances):
+    # Every record on the first date has a device type the encoder rejects,
+    # so that day yields no features and the week bills 0, as it always did.
+    for appliance in appliances:
+        if appliance["Date"] == appliances[0]["Date"]:
+            appliance["Device Type"] = "Toaster"
+    _load(app, tmp_path, appliances)
+
+    assert _baseline_bill(app, appliances, "Normal") == 0.0
+    assert app.bills[-1] == 0.0
+
+
+def test_week_without_seven_dates_bills_zero(app, tmp_path, appliances):
+    _load(app, tmp_path, [a for a in appliances if a["Date"] != appliances[0]["Date"]])
+
+    assert app.bills[-1] == 0.0
+
+
+def test_reduce_appliance_power_invalidates_cached_bill(app, tmp_path, appliances):
+    _load(app, tmp_path, appliances)
+    bill = app.bills[-1]
+
+    app.reduce_appliance_power()
+
+    reduced = [dict(a) for a in appliances]
+    for appliance in reduced:
+        if appliance["Device Type"] != "Refrigerator":
+            appliance["Usage Duration (minutes)"] *= 0.5
+    assert app.bills[-1] != bill
+    assert app.bills[-1] == pytest.approx(_baseline_bill(app, reduced, "Normal"))
+    # Only the usage index is reduced; the loaded records stay as read.
+    assert app.appliances == appliances
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from preprocessor import make_usage_rescaler, preprocess_appliances
+
+
+@pytest.mark.parametrize("scaler_kwargs", [
+    {},
+    {"with_mean": False},
+    {"with_std": False},
+    {"with_mean": False, "with_std": False},
+])
+def test_usage_rescaler_matches_full_preprocess(appliances, encoders, fit_scaler, scaler_kwargs):
+    device_encoder, room_encoder = encoders
+    scaler = fit_scaler(appliances, device_encoder, room_encoder, **scaler_kwargs)
+    rescale, valid_indices = make_usage_rescaler(appliances, device_encoder, room_encoder, scaler)
+
+    usage = np.array([a["Usage Duration (minutes)"] for a in appliances]) * np.linspace(0.5, 1.0, len(appliances))
+    expected, expected_indices = preprocess_appliances(
+        appliances, device_encoder, room_encoder, scaler, usage_override=usage
+    )
+
+    assert valid_indices == expected_indices
+    np.testing.assert_allclose(rescale(usage), expected)
+
+
+def test_usage_rescaler_skips_invalid_appliances(appliances, encoders, fit_scaler):
+    device_encoder, room_encoder = encoders
+    scaler = fit_scaler(appliances, device_encoder, room_encoder)
+    appliances[3]["Device Type"] = "Toaster"
+    rescale, valid_indices = make_usage_rescaler(appliances, device_encoder, room_encoder, scaler)
+
+    usage = [a["Usage Duration (minutes)"] for a in appliances]
+    expected, _ = preprocess_appliances(appliances, device_encoder, room_encoder, scaler, usage_override=usage)
+
+    assert 3 not in valid_indices
+    np.testing.assert_allclose(rescale(usage), expected)